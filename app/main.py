@@ -1,84 +1,181 @@
+import functools
 import json
 
-import requests
-from flask import Flask, jsonify, render_template, redirect, request
+from flask import Flask, Response, jsonify, make_response, render_template, redirect, request
 
 from form_formatter.append_snapshot_formatter import AppendSnapshotFormatter
 from form_formatter.update_frequency_formatter import UpdateFrequencyFormatter
 from form_formatter.update_open_date_formatter import UpdateOpenDateFormatter
 from portfolio_creator.data_source import DataSource
+from portfolio_creator.ledger_client import LedgerClient
+from portfolio_creator.portfolio_cache import PortfolioCache
 from portfolio_creator.portfolio_creator import PortfolioCreator
+from portfolio_creator.portfolio_refresher import PortfolioRefresher
 from report.balance_sheet import BalanceSheet
 from report.line_graph import LineGraph
-from utilities.constants import Constants
 from utilities.epoch_date_converter import EpochDateConverter
+from utilities.response_cache import ResponseCache
 from valid_options.account_type import AccountType
 from flask_cors import CORS
 
 app = Flask(__name__)
 CORS(app)
-portfolio = PortfolioCreator().create(DataSource())
+ledger = LedgerClient()
+data_source = DataSource(client=ledger)
+cache = PortfolioCache()
+refresher = PortfolioRefresher(data_source, cache=cache).start()
+response_cache = ResponseCache()
+
+
+def cached(view):
+    @functools.wraps(view)
+    def cached_view(**kwargs):
+        portfolio = refresher.portfolio()
+        version = portfolio.version()
+        key = (request.path, tuple(sorted(request.args.items(multi=True))), request.headers.get("Accept"),
+               EpochDateConverter().epoch_to_date())
+        etag = ResponseCache.etag(version, key)
+        if request.if_none_match.contains(etag):
+            response = Response(status=304)
+        else:
+            entry = response_cache.get(version, key)
+            if entry is None:
+                rendered = make_response(view(portfolio, **kwargs))
+                if rendered.status_code != 200:
+                    return rendered
+                series_headers = [(name, value) for name, value in rendered.headers if name.startswith("X-Series")]
+                entry = (rendered.get_data(), rendered.mimetype, series_headers)
+                response_cache.put(version, key, entry)
+            response = Response(entry[0], mimetype=entry[1], headers=entry[2])
+        response.set_etag(etag)
+        response.headers["Cache-Control"] = "no-cache"
+        response.headers["Vary"] = "Accept"
+        return response
+    return cached_view
 
 
 @app.route("/")
 def index():
     account_types = [e.value for e in AccountType]
-    return render_template('index.html', account_types=account_types, institutions=portfolio.institutions())
+    return render_template('index.html', account_types=account_types, institutions=refresher.portfolio().institutions())
 
 
 @app.route("/accounts")
-def accounts():
+@cached
+def accounts(portfolio):
     return render_template('accounts.html', portfolio=portfolio)
 
 
 @app.route("/accounts/<account_uuid>")
 def account(account_uuid):
-    account = list(filter(lambda x: x.uuid() == account_uuid, portfolio.accounts))[0]
+    account = list(filter(lambda x: x.uuid() == account_uuid, refresher.portfolio().accounts))[0]
     return render_template('account.html', account=account)
 
 
 @app.route("/append_snapshot", methods=['POST'])
 def append_snapshot():
-    global portfolio
-    request_body = AppendSnapshotFormatter(EpochDateConverter()).format(request.form.to_dict())
+    try:
+        request_body = AppendSnapshotFormatter(EpochDateConverter()).format(request.form.to_dict())
+        PortfolioCreator().validate_snapshot(request_body)
+    except ValueError as error:
+        return jsonify({"error": str(error)}), 400
     json_body = json.dumps(request_body)
-    requests.post(Constants.DATA_URL + "/append_snapshot", data=json_body)
-    portfolio = PortfolioCreator().create(DataSource())
+    response = ledger.post("/append_snapshot", json_body)
+    if response.ok:
+        refresher.apply(lambda portfolio: PortfolioCreator().append_snapshot(portfolio, request_body))
     return redirect("/accounts", code=302)
 
 
 @app.route("/update_frequency", methods=['POST'])
 def update_frequency():
-    global portfolio
     request_body = UpdateFrequencyFormatter().format(request.form.to_dict())
     json_body = json.dumps(request_body)
-    requests.post(Constants.DATA_URL + "/update_frequency", data=json_body)
-    portfolio = PortfolioCreator().create(DataSource())
+    response = ledger.post("/update_frequency", json_body)
+    if response.ok:
+        refresher.apply(lambda portfolio: PortfolioCreator().update_frequency(portfolio, request_body))
     return redirect("/accounts", code=302)
 
 @app.route("/update_open_date", methods=['POST'])
 def update_open_date():
-    global portfolio
     request_body = UpdateOpenDateFormatter().format(request.form.to_dict())
     json_body = json.dumps(request_body)
     print(json_body)
-    requests.post(Constants.DATA_URL + "/update_open_date", data=json_body)
-    portfolio = PortfolioCreator().create(DataSource())
+    response = ledger.post("/update_open_date", json_body)
+    if response.ok:
+        refresher.apply(lambda portfolio: PortfolioCreator().update_open_date(portfolio, request_body))
     return redirect("/accounts", code=302)
 
 @app.route("/balance_sheet")
 def balance_sheet():
-    return render_template('balance_sheet.html', balance_sheet=BalanceSheet(portfolio))
+    return render_template('balance_sheet.html', balance_sheet=BalanceSheet(refresher.portfolio()))
 
 @app.route("/balance_sheet_rows")
-def balance_sheet_rows():
+@cached
+def balance_sheet_rows(portfolio):
     return jsonify(BalanceSheet(portfolio).json())
 
 @app.route("/net_worth")
-def net_worth():
+@cached
+def net_worth(portfolio):
     start = request.args.get('start')
     end = request.args.get('end')
-    return jsonify(LineGraph(portfolio).net_worth_vs_time(start, end))
+    resolution = request.args.get('resolution', 'daily')
+    max_points = request.args.get('max_points', type=int)
+    mimetype = request.accept_mimetypes.best_match(["application/json", "application/octet-stream"])
+    try:
+        if mimetype == "application/octet-stream":
+            return binary_columns(LineGraph(portfolio).net_worth_columns(start, end, resolution, max_points))
+        if request.args.get('format') == 'columns':
+            columns = LineGraph(portfolio).net_worth_columns(start, end, resolution, max_points)
+            columns["values"] = columns["values"].tolist()
+            if "offsets" in columns:
+                columns["offsets"] = columns["offsets"].tolist()
+            return jsonify(columns)
+        return jsonify(LineGraph(portfolio).net_worth_vs_time(start, end, resolution, max_points))
+    except ValueError as error:
+        return jsonify({"error": str(error)}), 400
+
+
+def binary_columns(columns):
+    values = columns["values"].astype("<f8")
+    headers = {"X-Series-Name": columns["series"],
+               "X-Series-Start": columns["start"],
+               "X-Series-Length": str(len(values))}
+    if "step" in columns:
+        headers["X-Series-Step"] = str(columns["step"])
+        body = values.tobytes()
+    else:
+        offsets = columns["offsets"].astype("<i4")
+        body = offsets.tobytes() + bytes(-offsets.nbytes % 8) + values.tobytes()
+    return Response(body, mimetype="application/octet-stream", headers=headers)
+
+
+@app.route("/series")
+@cached
+def series(portfolio):
+    start = request.args.get('start')
+    end = request.args.get('end')
+    breakdown = request.args.getlist('breakdown')
+    resolution = request.args.get('resolution', 'daily')
+    try:
+        output = LineGraph(portfolio).series(start, end, breakdown, resolution)
+    except ValueError as error:
+        return jsonify({"error": str(error)}), 400
+    output["series"] = dict((name, values.tolist()) for name, values in output["series"].items())
+    if "offsets" in output:
+        output["offsets"] = output["offsets"].tolist()
+    return jsonify(output)
+
+
+@app.route("/ready")
+def ready():
+    readiness = refresher.ready()
+    return jsonify(readiness), 200 if readiness["ready"] else 503
+
+
+@app.route("/status")
+def status():
+    return jsonify(refresher.status())
 
 
 @app.route("/net_worth_vs_time")
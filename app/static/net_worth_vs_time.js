@@ -34,7 +34,7 @@ var svg = d3.select(".container")
     .attr("transform",
           "translate(" + margin.left + "," + margin.top + ")");
 
-d3.json("/net_worth?start=" + start + "&end=" + end, function(error, data) {
+d3.json("/net_worth?start=" + start + "&end=" + end + "&max_points=" + width, function(error, data) {
   if (error) throw error;
 
   data.forEach(function(d) {
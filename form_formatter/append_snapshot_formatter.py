@@ -17,6 +17,6 @@ class AppendSnapshotFormatter:
         return form_data
 
     def __format_timestamp(self, form_data):
-        if "timestamp" not in form_data:
+        if not form_data.get("timestamp"):
             form_data["timestamp"] = self.timestamp_generator.epoch_to_date()
         return form_data
@@ -37,6 +37,9 @@ class Account:
     def update_frequency(self):
         return self.__update_frequency or 7
 
+    def set_update_frequency(self, update_frequency):
+        self.__update_frequency = update_frequency
+
     def asset_class(self):
         return self.__asset_class.value
 
@@ -46,25 +49,72 @@ class Account:
     def open_date(self):
         return self.__open_date
 
+    def set_open_date(self, open_date):
+        self.__open_date = open_date
+
     def uuid(self):
         return self.__uuid
 
     def value(self, query_time=None):
         return self.__history.value(query_time)
 
+    def value_on(self, ordinal):
+        return self.__history.value_on(ordinal)
+
+    def values_at(self, query_times):
+        return self.__history.values_at(query_times)
+
+    def values_on(self, query_ordinals):
+        return self.__history.values_on(query_ordinals)
+
+    def change_points(self):
+        return self.__history.change_points()
+
+    def snapshots(self):
+        return self.__history.all()
+
+    def columns(self):
+        return self.__history.columns()
+
     def import_snapshot(self, time, value):
         snapshot = Snapshot(time, value)
         return self.__history.import_snapshot(snapshot)
 
+    def import_snapshots(self, snapshots):
+        return self.__history.import_snapshots([Snapshot(time, value) for time, value in snapshots])
+
+    def import_columns(self, timestamps, ordinals, values):
+        return self.__history.import_columns(timestamps, ordinals, values)
+
+    def copy(self):
+        account = Account({"name": self.__name,
+                           "owner": self.__owner,
+                           "investment": self.__investment,
+                           "asset_class": self.__asset_class,
+                           "institution": self.__institution,
+                           "account_type": self.__account_type,
+                           "update_frequency": self.__update_frequency,
+                           "term": self.__term,
+                           "open_date": self.__open_date,
+                           "uuid": self.__uuid})
+        account.import_columns(*self.columns())
+        return account
+
+    def has_snapshot(self, time, value):
+        return self.__history.contains(Snapshot(time, value))
+
     def last_updated(self):
         return self.__history.last_updated()
 
+    def identity(self):
+        return (self.name(),
+                self.owner(),
+                self.investment(),
+                self.asset_class(),
+                self.institution(),
+                self.account_type(),
+                self.open_date(),
+                self.term())
+
     def is_identical_to(self, account):
-        return (self.name() == account.name() and
-                self.owner() == account.owner() and
-                self.investment() == account.investment() and
-                self.asset_class() == account.asset_class() and
-                self.institution() == account.institution() and
-                self.account_type() == account.account_type() and
-                self.open_date() == account.open_date() and
-                self.term() == account.term())
+        return self.identity() == account.identity()
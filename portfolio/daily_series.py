@@ -0,0 +1,54 @@
+import threading
+
+import numpy
+
+
+class DailySeries:
+    def __init__(self, compute):
+        self.compute = compute
+        self.__first = None
+        self.__values = numpy.empty(0)
+        self.__lock = threading.Lock()
+
+    def between(self, first, last):
+        if last < first:
+            return numpy.empty(0)
+        with self.__lock:
+            if self.__first is None or len(self.__values) == 0:
+                self.__first = first
+                self.__values = self.__compute(first, last)
+            elif first < self.__first:
+                self.__values = numpy.concatenate((self.__compute(first, self.__first - 1), self.__values))
+                self.__first = first
+            cached_last = self.__first + len(self.__values) - 1
+            if last > cached_last:
+                self.__values = numpy.concatenate((self.__values, self.__compute(cached_last + 1, last)))
+            return self.__values[first - self.__first:last - self.__first + 1].copy()
+
+    def on(self, ordinals):
+        ordinals = numpy.asarray(ordinals, dtype=numpy.int32)
+        if len(ordinals) == 0:
+            return numpy.empty(0)
+        with self.__lock:
+            if self.__first is not None and ordinals.min() >= self.__first and \
+                    ordinals.max() < self.__first + len(self.__values):
+                return self.__values[ordinals - self.__first]
+        return numpy.asarray(self.compute(ordinals), dtype=float)
+
+    def copy(self, compute):
+        series = DailySeries(compute)
+        with self.__lock:
+            series.__first = self.__first
+            series.__values = self.__values
+        return series
+
+    def invalidate_from(self, ordinal):
+        with self.__lock:
+            if self.__first is not None:
+                self.__values = self.__values[:max(0, ordinal - self.__first)]
+
+    def __len__(self):
+        return len(self.__values)
+
+    def __compute(self, first, last):
+        return numpy.asarray(self.compute(numpy.arange(first, last + 1, dtype=numpy.int32)), dtype=float)
@@ -1,6 +1,13 @@
-from collections import defaultdict
+import heapq
+import itertools
+import time
+from collections import OrderedDict, defaultdict
+
+import numpy
 
 from portfolio.account_builder import AccountBuilder
+from portfolio.daily_series import DailySeries
+from portfolio.value_timeline import ValueTimeline
 from utilities.constants import Constants
 from utilities.epoch_date_converter import EpochDateConverter
 from valid_options.account_type import AccountType
@@ -9,56 +16,152 @@ from valid_options.term import Term
 
 
 class Portfolio:
+    DIMENSIONS = ["name", "owner", "institution", "investment", "asset_class", "term", "account_type"]
+    IDENTITY_FIELDS = ["name", "owner", "investment", "asset_class", "institution", "account_type", "open_date", "term"]
+    VERSIONS = itertools.count(1)
+
     def __init__(self):
         self.accounts = []
+        self.__accounts_by_identity = {}
+        self.__indexes = dict((dimension, defaultdict(list)) for dimension in Portfolio.DIMENSIONS)
+        self.__version = next(Portfolio.VERSIONS)
+        self.__net_worth_timeline = None
+        self.__daily_net_worth = DailySeries(self.__net_worth_values_on)
+        self.__shared = set()
+        self.__copies = {}
+
+    def version(self):
+        return self.__version
 
     def assets(self):
-        return list(filter(lambda x: x.account_type() == "ASSET", self.accounts))
+        return list(self.__indexes["account_type"].get("ASSET", []))
 
     def outdated_assets(self):
         return self.__outdated_account(self.assets())
 
     def liabilities(self):
-        return list(filter(lambda x: x.account_type() == "LIABILITY", self.accounts))
+        return list(self.__indexes["account_type"].get("LIABILITY", []))
 
     def outdated_liabilities(self):
         return self.__outdated_account(self.liabilities())
 
+    def non_mortgage_liabilities(self):
+        return self.__liabilities_without_mortgage()
+
     def import_data(self, data):
-        account = AccountBuilder()\
-            .set_name(data.get("name"))\
-            .set_institution(data.get("institution"))\
-            .set_owner(data.get("owner"))\
-            .set_investment(data.get("investment"))\
-            .set_asset_class(AssetClass(data.get("asset_class")))\
-            .set_account_type(AccountType(data.get("account_type")))\
-            .set_update_frequency(data.get("update_frequency"))\
-            .set_open_date(data.get("open_date"))\
-            .set_term(Term(data.get("term")))\
-            .build()
+        account = self.__build_account(data)
         self.__create_or_update(data.get("timestamp"), data.get("value"), account)
+        self.__snapshots_changed(EpochDateConverter().date_to_ordinal(data.get("timestamp")))
+
+    def import_many(self, rows, skip_existing=False):
+        timings = {}
+        start = time.perf_counter()
+        groups = OrderedDict()
+        for index, data in enumerate(rows):
+            key = tuple(data.get(field) for field in Portfolio.IDENTITY_FIELDS)
+            groups.setdefault(key, []).append(index)
+        timings["group"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        accounts = OrderedDict()
+        for indices in groups.values():
+            account = self.__build_account(rows[indices[0]])
+            existing_account = self.__accounts_by_identity.get(account.identity())
+            if existing_account is None:
+                self.__add_account(account)
+                existing_account = account
+            accounts.setdefault(existing_account, []).append(indices)
+        timings["build"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        converter = EpochDateConverter()
+        inserted = 0
+        first_changed = None
+        for account, groups_of_indices in accounts.items():
+            indices = list(heapq.merge(*groups_of_indices))
+            epochs = converter.dates_to_epochs([rows[index].get("timestamp") for index in indices])
+            snapshots = list(zip(epochs, [rows[index].get("value") for index in indices]))
+            if skip_existing:
+                snapshots = [(epoch, value) for epoch, value in snapshots if not account.has_snapshot(epoch, value)]
+            if not snapshots:
+                continue
+            account = self.__own(account)
+            account.import_snapshots(snapshots)
+            inserted += len(snapshots)
+            ordinal = converter.epoch_to_ordinal(min(epoch for epoch, value in snapshots))
+            first_changed = ordinal if first_changed is None else min(first_changed, ordinal)
+        timings["attach"] = time.perf_counter() - start
+        if inserted:
+            self.__snapshots_changed(first_changed)
+        return inserted, timings
 
     def import_account(self, account):
-        for existing_account in self.accounts:
-            if existing_account.is_identical_to(account):
-                return
-        self.accounts.append(account)
+        if account.identity() in self.__accounts_by_identity:
+            return
+        self.__add_account(account)
+        ordinals = account.columns()[1]
+        if len(ordinals) > 0:
+            self.__snapshots_changed(int(ordinals[0]))
+        self.__changed()
 
-    def percentages(self):
-        output = defaultdict(float)
-        for asset in self.assets():
-            output[asset.investment()] += asset.value()
-        self.__normalize_output(output)
-        return output
+    def copy(self):
+        portfolio = Portfolio()
+        for account in self.accounts:
+            portfolio.__add_account(account)
+        portfolio.__shared = set(self.accounts)
+        portfolio.__net_worth_timeline = self.__net_worth_timeline
+        portfolio.__daily_net_worth = self.__daily_net_worth.copy(portfolio.__net_worth_values_on)
+        return portfolio
+
+    def accounts_matching(self, filter):
+        self.__validate_dimensions(filter.keys())
+        return self.__matching_accounts(filter)
+
+    def append_snapshot(self, account, date, value):
+        account = self.__own(account)
+        account.import_snapshot(EpochDateConverter().date_to_epoch(date), value)
+        self.__snapshots_changed(EpochDateConverter().date_to_ordinal(date))
 
-    def asset_classes(self):
+    def update_frequency(self, account, update_frequency):
+        account = self.__own(account)
+        account.set_update_frequency(update_frequency)
+        self.__changed()
+
+    def update_open_date(self, account, open_date):
+        account = self.__own(account)
+        del self.__accounts_by_identity[account.identity()]
+        account.set_open_date(open_date)
+        existing_account = self.__accounts_by_identity.get(account.identity())
+        if existing_account is None:
+            self.__accounts_by_identity[account.identity()] = account
+            self.__changed()
+            return
+        existing_account = self.__own(existing_account)
+        timestamps, ordinals, values = account.columns()
+        existing_account.import_snapshots(zip(timestamps.tolist(), values.tolist()))
+        self.__remove_account(account)
+        self.__snapshots_changed(int(ordinals[0]) if len(ordinals) > 0 else EpochDateConverter().date_to_ordinal())
+
+    def percentages(self, date=None):
+        return self.__allocation(lambda asset: asset.investment(), defaultdict(float), date)
+
+    def asset_classes(self, date=None):
         output = dict((v, 0) for v in [e.value for e in AssetClass])
-        for asset in self.assets():
-            output[asset.asset_class()] += asset.value()
-        self.__normalize_output(output)
+        self.__allocation(lambda asset: asset.asset_class(), output, date)
         del output["None"]
         return output
 
+    def group_by(self, keys, date=None, filter=None):
+        dimensions = [keys] if isinstance(keys, str) else list(keys)
+        filter = filter or {}
+        self.__validate_dimensions(dimensions + list(filter.keys()))
+        query_time = EpochDateConverter().date_to_epoch(date)
+        output = defaultdict(float)
+        for account in self.__matching_accounts(filter):
+            group = tuple(getattr(account, dimension)() for dimension in dimensions)
+            output[group[0] if isinstance(keys, str) else group] += account.value(query_time)
+        return dict(output)
+
     def total_value(self, date=None):
         return self.assets_value(date) - self.liabilities_value(date)
 
@@ -69,38 +172,158 @@ class Portfolio:
         return self.__value_of(self.liabilities(), date)
 
     def liabilities_without_mortgage(self, date=None):
-        accounts = []
-        for liability in self.liabilities():
-            if (liability.name() != "Mortgage"):
-                accounts.append(liability)
-        return self.__value_of(accounts, date)
+        return self.__value_of(self.__liabilities_without_mortgage(), date)
+
+    def net_worth_timeline(self):
+        if self.__net_worth_timeline is None:
+            weighted_accounts = [(asset, 1) for asset in self.assets()]
+            weighted_accounts += [(liability, -1) for liability in self.liabilities()]
+            self.__net_worth_timeline = ValueTimeline(weighted_accounts)
+        return self.__net_worth_timeline
+
+    def series_on(self, ordinals, series_weights):
+        assets = self.assets()
+        liabilities = self.liabilities()
+        weights = OrderedDict()
+        for name, weigh in series_weights.items():
+            weights[name] = [weigh(asset) for asset in assets] + [-weigh(liability) for liability in liabilities]
+        return self.net_worth_timeline().series_on(ordinals, weights)
+
+    def net_worth_between(self, start_date, end_date):
+        converter = EpochDateConverter()
+        return self.__daily_net_worth.between(converter.date_to_ordinal(start_date), converter.date_to_ordinal(end_date))
+
+    def net_worth_on(self, ordinals):
+        return self.__daily_net_worth.on(ordinals)
+
+    def values_at(self, query_times):
+        return self.assets_values_at(query_times) - self.liabilities_values_at(query_times)
+
+    def assets_values_at(self, query_times):
+        return self.__values_at(self.assets(), query_times)
+
+    def liabilities_values_at(self, query_times):
+        return self.__values_at(self.liabilities(), query_times)
+
+    def liabilities_without_mortgage_values_at(self, query_times):
+        return self.__values_at(self.__liabilities_without_mortgage(), query_times)
 
     def institutions(self):
         return list(set(map(lambda x: x.institution(), self.accounts)))
 
     def __outdated_account(self, accounts):
         output = []
+        converter = EpochDateConverter()
+        current_epoch = converter.date_to_epoch()
         for account in accounts:
-            last_updated = EpochDateConverter().date_to_epoch(account.last_updated())
-            expected_update = EpochDateConverter().date_to_epoch() - account.update_frequency() * Constants.SECONDS_PER_DAY
+            last_updated = converter.date_to_epoch(account.last_updated())
+            expected_update = current_epoch - account.update_frequency() * Constants.SECONDS_PER_DAY
             if last_updated < expected_update:
                 output.append(account)
         return output
 
+    def __net_worth_values_on(self, ordinals):
+        return self.net_worth_timeline().values_on(ordinals)
+
     def __value_of(self, accounts, date=None):
-        return sum(account.value(EpochDateConverter().date_to_epoch(date)) for account in accounts)
+        query_time = EpochDateConverter().date_to_epoch(date)
+        return sum(account.value(query_time) for account in accounts)
+
+    def __values_at(self, accounts, query_times):
+        output = numpy.zeros(len(query_times))
+        for account in accounts:
+            output += account.values_at(query_times)
+        return output
 
-    def __normalize_output(self, output):
-        for key, value in output.items():
-            if self.total_value() == 0:
-                output[key] = 0
+    def __liabilities_without_mortgage(self):
+        accounts = []
+        for liability in self.liabilities():
+            if (liability.name() != "Mortgage"):
+                accounts.append(liability)
+        return accounts
+
+    def __allocation(self, key, output, date=None):
+        query_time = EpochDateConverter().date_to_epoch(date)
+        assets_value = 0
+        liabilities_value = 0
+        for account in self.accounts:
+            value = account.value(query_time)
+            if account.account_type() == "ASSET":
+                output[key(account)] += value
+                assets_value += value
+            else:
+                liabilities_value += value
+        for k, value in output.items():
+            if assets_value - liabilities_value == 0:
+                output[k] = 0
             else:
-                output[key] = round(float(value) / self.__value_of(self.assets()), 3)
+                output[k] = round(float(value) / assets_value, 3)
+        return output
+
+    def __changed(self):
+        self.__version = next(Portfolio.VERSIONS)
+
+    def __snapshots_changed(self, ordinal):
+        self.__net_worth_timeline = None
+        self.__daily_net_worth.invalidate_from(ordinal)
+        self.__changed()
 
     def __create_or_update(self, date, value, account):
-        for existing_account in self.accounts:
-            if existing_account.is_identical_to(account):
-                existing_account.import_snapshot(EpochDateConverter().date_to_epoch(date), value)
-                return
+        existing_account = self.__accounts_by_identity.get(account.identity())
+        if existing_account is not None:
+            existing_account = self.__own(existing_account)
+            existing_account.import_snapshot(EpochDateConverter().date_to_epoch(date), value)
+            return
         account.import_snapshot(EpochDateConverter().date_to_epoch(date), value)
+        self.__add_account(account)
+
+    def __build_account(self, data):
+        return AccountBuilder()\
+            .set_name(data.get("name"))\
+            .set_institution(data.get("institution"))\
+            .set_owner(data.get("owner"))\
+            .set_investment(data.get("investment"))\
+            .set_asset_class(AssetClass(data.get("asset_class")))\
+            .set_account_type(AccountType(data.get("account_type")))\
+            .set_update_frequency(data.get("update_frequency"))\
+            .set_open_date(data.get("open_date"))\
+            .set_term(Term(data.get("term")))\
+            .build()
+
+    def __add_account(self, account):
         self.accounts.append(account)
+        self.__accounts_by_identity[account.identity()] = account
+        for dimension, index in self.__indexes.items():
+            index[getattr(account, dimension)()].append(account)
+
+    def __own(self, account):
+        if account in self.__copies:
+            return self.__copies[account]
+        if account not in self.__shared:
+            return account
+        self.__shared.remove(account)
+        copy = account.copy()
+        self.__copies[account] = copy
+        self.accounts[self.accounts.index(account)] = copy
+        self.__accounts_by_identity[account.identity()] = copy
+        for dimension, index in self.__indexes.items():
+            group = index[getattr(account, dimension)()]
+            group[group.index(account)] = copy
+        return copy
+
+    def __remove_account(self, account):
+        self.accounts.remove(account)
+        for dimension, index in self.__indexes.items():
+            index[getattr(account, dimension)()].remove(account)
+
+    def __matching_accounts(self, filter):
+        if not filter:
+            return list(self.accounts)
+        candidates = min((self.__indexes[dimension].get(value, []) for dimension, value in filter.items()), key=len)
+        return [account for account in candidates
+                if all(getattr(account, dimension)() == value for dimension, value in filter.items())]
+
+    def __validate_dimensions(self, dimensions):
+        for dimension in dimensions:
+            if dimension not in Portfolio.DIMENSIONS:
+                raise ValueError("Cannot group accounts by " + str(dimension) + ".")
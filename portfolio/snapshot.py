@@ -1,4 +1,21 @@
+from typing import Optional
+
+from utilities.epoch_date_converter import EpochDateConverter
+
+
 class Snapshot:
-    def __init__(self, timestamp, value: int) -> None:
+    __slots__ = ["timestamp", "value", "ordinal"]
+
+    def __init__(self, timestamp, value: int, ordinal: Optional[int] = None) -> None:
         self.timestamp = timestamp
         self.value = value
+        self.ordinal = EpochDateConverter().epoch_to_ordinal(timestamp) if ordinal is None else ordinal
+
+    def __eq__(self, other):
+        return (isinstance(other, Snapshot) and
+                self.timestamp == other.timestamp and
+                self.value == other.value and
+                self.ordinal == other.ordinal)
+
+    def __hash__(self):
+        return hash((self.timestamp, self.value, self.ordinal))
@@ -1,31 +1,98 @@
+import bisect
+from array import array
+
+import numpy
+
+from portfolio.snapshot import Snapshot
 from utilities.epoch_date_converter import EpochDateConverter
 
 
 class SnapshotHistory:
     def __init__(self):
-        self.snapshots = []
+        self.__timestamps = array("d")
+        self.__values = array("d")
+        self.__ordinals = array("i")
+        self.__arrays = None
 
     def import_snapshot(self, snapshot):
-        self.snapshots.append(snapshot)
-        self.snapshots.sort(key=lambda x: x.timestamp)
+        index = bisect.bisect_right(self.__timestamps, snapshot.timestamp)
+        self.__timestamps.insert(index, snapshot.timestamp)
+        self.__values.insert(index, snapshot.value)
+        self.__ordinals.insert(index, snapshot.ordinal)
+        self.__arrays = None
+
+    def import_snapshots(self, snapshots):
+        merged = list(zip(self.__timestamps, self.__values, self.__ordinals))
+        merged.extend((snapshot.timestamp, snapshot.value, snapshot.ordinal) for snapshot in snapshots)
+        merged.sort(key=lambda row: row[0])
+        self.__timestamps = array("d", [row[0] for row in merged])
+        self.__values = array("d", [row[1] for row in merged])
+        self.__ordinals = array("i", [row[2] for row in merged])
+        self.__arrays = None
+
+    def import_columns(self, timestamps, ordinals, values):
+        if self.__timestamps:
+            return self.import_snapshots([Snapshot(timestamp, value, ordinal) for timestamp, ordinal, value
+                                          in zip(timestamps.tolist(), ordinals.tolist(), values.tolist())])
+        self.__timestamps = array("d", numpy.asarray(timestamps, dtype=numpy.float64).tobytes())
+        self.__ordinals = array("i", numpy.asarray(ordinals, dtype=numpy.int32).tobytes())
+        self.__values = array("d", numpy.asarray(values, dtype=numpy.float64).tobytes())
+        self.__arrays = None
+
+    def contains(self, snapshot):
+        start = bisect.bisect_left(self.__timestamps, snapshot.timestamp)
+        end = bisect.bisect_right(self.__timestamps, snapshot.timestamp)
+        return snapshot.value in self.__values[start:end]
 
     def all(self):
-        return self.snapshots
+        return [Snapshot(timestamp, value, ordinal)
+                for timestamp, value, ordinal in zip(self.__timestamps, self.__values, self.__ordinals)]
+
+    def columns(self):
+        timestamps, ordinals, values = self.__as_arrays()
+        return timestamps, ordinals, values[1:]
 
     def value(self, query_time=None):
-        if not self.snapshots:
+        if not self.__timestamps:
             return 0
         if query_time is None:
             return self.__find_value(EpochDateConverter().date_to_epoch())
         return self.__find_value(query_time)
 
+    def value_on(self, ordinal):
+        index = bisect.bisect_right(self.__ordinals, ordinal)
+        if index == 0:
+            return 0
+        return self.__values[index - 1]
+
+    def values_at(self, query_times):
+        timestamps, ordinals, values = self.__as_arrays()
+        indices = numpy.searchsorted(timestamps, numpy.asarray(query_times, dtype=float), side="right")
+        return values[indices]
+
+    def values_on(self, query_ordinals):
+        timestamps, ordinals, values = self.__as_arrays()
+        indices = numpy.searchsorted(ordinals, numpy.asarray(query_ordinals, dtype=numpy.int32), side="right")
+        return values[indices]
+
+    def change_points(self):
+        timestamps, ordinals, values = self.__as_arrays()
+        return timestamps, ordinals, numpy.diff(values)
+
     def last_updated(self):
-        timestamp = self.snapshots[-1].timestamp
+        timestamp = self.__timestamps[-1]
         return EpochDateConverter().epoch_to_date(timestamp)
 
     def __find_value(self, query_time):
-        value = 0
-        for snapshot in self.snapshots:
-            if query_time >= snapshot.timestamp:
-                value = snapshot.value
-        return value
+        index = bisect.bisect_right(self.__timestamps, query_time)
+        if index == 0:
+            return 0
+        return self.__values[index - 1]
+
+    def __as_arrays(self):
+        if self.__arrays is None:
+            timestamps = numpy.array(self.__timestamps, dtype=float)
+            ordinals = numpy.array(self.__ordinals, dtype=numpy.int32)
+            values = numpy.concatenate(([0.0], numpy.array(self.__values, dtype=float)))
+            self.__arrays = (timestamps, ordinals, values)
+        return self.__arrays
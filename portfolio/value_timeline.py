@@ -0,0 +1,48 @@
+from collections import OrderedDict
+
+import numpy
+
+
+class ValueTimeline:
+    def __init__(self, weighted_accounts):
+        timestamps = [numpy.empty(0)]
+        ordinals = [numpy.empty(0, dtype=numpy.int32)]
+        deltas = [numpy.empty(0)]
+        owners = [numpy.empty(0, dtype=int)]
+        for index, (account, weight) in enumerate(weighted_accounts):
+            account_timestamps, account_ordinals, account_deltas = account.change_points()
+            timestamps.append(account_timestamps)
+            ordinals.append(account_ordinals)
+            deltas.append(account_deltas * weight)
+            owners.append(numpy.full(len(account_deltas), index, dtype=int))
+        self.__timestamps = numpy.concatenate(timestamps)
+        self.__ordinals = numpy.concatenate(ordinals)
+        self.__deltas = numpy.concatenate(deltas)
+        self.__owners = numpy.concatenate(owners)
+
+    def values_at(self, query_times):
+        return self.__accumulate(self.__timestamps, numpy.asarray(query_times, dtype=float))
+
+    def values_on(self, query_ordinals):
+        return self.__accumulate(self.__ordinals, numpy.asarray(query_ordinals, dtype=numpy.int32))
+
+    def series_on(self, query_ordinals, series_weights):
+        query_ordinals = numpy.asarray(query_ordinals, dtype=numpy.int32)
+        buckets = numpy.searchsorted(query_ordinals, self.__ordinals, side="left")
+        output = OrderedDict()
+        for name, weights in series_weights.items():
+            deltas = self.__deltas * numpy.asarray(weights, dtype=float)[self.__owners]
+            output[name] = self.__sum_buckets(buckets, deltas, len(query_ordinals))
+        return output
+
+    def change_ordinals(self, first, last):
+        changed = (self.__ordinals > first) & (self.__ordinals <= last) & (self.__deltas != 0)
+        return numpy.unique(self.__ordinals[changed])
+
+    def __accumulate(self, change_points, queries):
+        buckets = numpy.searchsorted(queries, change_points, side="left")
+        return self.__sum_buckets(buckets, self.__deltas, len(queries))
+
+    def __sum_buckets(self, buckets, deltas, length):
+        changes = numpy.bincount(buckets, weights=deltas, minlength=length + 1)
+        return numpy.cumsum(changes[:length])
@@ -1,4 +1,12 @@
 import math
+from collections import OrderedDict
+
+import numpy
+
+from portfolio_analysis.rolling_statistics import RollingStatistics
+from utilities.constants import Constants
+from utilities.epoch_date_converter import EpochDateConverter
+from valid_options.term import Term
 
 
 class PortfolioAnalyzer:
@@ -7,7 +15,74 @@ class PortfolioAnalyzer:
         self.__portfolio = portfolio
 
     def debt_to_equity(self, date=None):
-        if self.__portfolio.total_value(date) == 0:
+        total_value = self.__portfolio.total_value(date)
+        if total_value == 0:
             return math.inf
         else:
-            return abs(self.__portfolio.liabilities_value(date) / self.__portfolio.total_value(date))
+            return abs(self.__portfolio.liabilities_value(date) / total_value)
+
+    def debt_to_equity_series(self, start_date, end_date):
+        series = self.__series(start_date, end_date, self.__balance_weights())
+        return self.__ratio(series["liabilities"], series["assets"] - series["liabilities"])
+
+    def debt_to_assets_series(self, start_date, end_date):
+        series = self.__series(start_date, end_date, self.__balance_weights())
+        return self.__ratio(series["liabilities"], series["assets"])
+
+    def liquidity_series(self, start_date, end_date):
+        weights = OrderedDict()
+        for term in Term:
+            weights[term.value + ":assets"] = self.__weights("ASSET", "term", term.value)
+            weights[term.value + ":liabilities"] = self.__weights("LIABILITY", "term", term.value)
+        series = self.__series(start_date, end_date, weights)
+        return OrderedDict((term.value, self.__ratio(series[term.value + ":assets"],
+                                                     series[term.value + ":liabilities"])) for term in Term)
+
+    def value_series(self, start_date, end_date):
+        weights = OrderedDict()
+        weights["portfolio"] = lambda account: 1 if account.account_type() == "ASSET" else -1
+        for asset_class in sorted(set(asset.asset_class() for asset in self.__portfolio.assets())):
+            weights["asset_class:" + asset_class] = self.__weights("ASSET", "asset_class", asset_class)
+        series = self.__series(start_date, end_date, weights)
+        ordinals = self.__ordinals(start_date, end_date)
+        output = OrderedDict([("portfolio", series.pop("portfolio"))])
+        for account in self.__portfolio.accounts:
+            output["account:" + account.uuid()] = account.values_on(ordinals)
+        output.update(series)
+        return output
+
+    def rolling_performance(self, start_date, end_date, period=Constants.ROLLING_PERIOD_DAYS,
+                            window=Constants.VOLATILITY_WINDOW_DAYS):
+        first_ordinal = EpochDateConverter().date_to_ordinal(start_date)
+        output = OrderedDict()
+        for name, values in self.value_series(start_date, end_date).items():
+            statistics = RollingStatistics(values, first_ordinal)
+            output[name] = {"value": values,
+                            "change": statistics.change(period),
+                            "growth": statistics.growth(period),
+                            "volatility": statistics.volatility(window),
+                            "max_drawdown": statistics.max_drawdown()}
+        return output
+
+    def __balance_weights(self):
+        weights = OrderedDict()
+        weights["assets"] = self.__weights("ASSET")
+        weights["liabilities"] = self.__weights("LIABILITY")
+        return weights
+
+    def __weights(self, account_type, dimension=None, value=None):
+        return lambda account: 1 if account.account_type() == account_type and \
+            (dimension is None or getattr(account, dimension)() == value) else 0
+
+    def __series(self, start_date, end_date, weights):
+        return self.__portfolio.series_on(self.__ordinals(start_date, end_date), weights)
+
+    def __ordinals(self, start_date, end_date):
+        converter = EpochDateConverter()
+        return numpy.arange(converter.date_to_ordinal(start_date), converter.date_to_ordinal(end_date) + 1,
+                            dtype=numpy.int32)
+
+    def __ratio(self, numerators, denominators):
+        ratios = numpy.full(len(numerators), math.inf)
+        numpy.divide(numpy.abs(numerators), numpy.abs(denominators), out=ratios, where=denominators != 0)
+        return ratios
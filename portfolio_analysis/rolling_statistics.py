@@ -0,0 +1,61 @@
+import math
+
+import numpy
+from numpy.lib.stride_tricks import as_strided
+
+from utilities.constants import Constants
+from utilities.epoch_date_converter import EpochDateConverter
+
+
+class RollingStatistics:
+    def __init__(self, values, first_ordinal):
+        self.values = numpy.asarray(values, dtype=float)
+        self.first_ordinal = first_ordinal
+
+    def change(self, period):
+        self.__validate(period, "period")
+        changes = numpy.full(len(self.values), math.nan)
+        changes[period:] = self.values[period:] - self.values[:-period]
+        return changes
+
+    def growth(self, period):
+        self.__validate(period, "period")
+        growth = numpy.full(len(self.values), math.nan)
+        current = self.values[period:]
+        previous = self.values[:-period]
+        positive = (current > 0) & (previous > 0)
+        ratios = numpy.divide(current, previous, out=numpy.ones(len(current)), where=positive)
+        growth[period:] = numpy.where(positive, ratios ** (Constants.DAYS_PER_YEAR / period) - 1, math.nan)
+        return growth
+
+    def volatility(self, window):
+        self.__validate(window, "window")
+        returns = self.__daily_returns()
+        volatility = numpy.full(len(self.values), math.nan)
+        if len(returns) < window:
+            return volatility
+        windows = as_strided(returns, shape=(len(returns) - window + 1, window),
+                             strides=(returns.strides[0], returns.strides[0]), writeable=False)
+        volatility[window:] = numpy.sqrt(windows.var(axis=1) * Constants.DAYS_PER_YEAR)
+        return volatility
+
+    def max_drawdown(self):
+        converter = EpochDateConverter()
+        if len(self.values) == 0:
+            return {"drawdown": 0.0, "peak": None, "trough": None}
+        peaks = numpy.maximum.accumulate(self.values)
+        drawdowns = numpy.divide(self.values - peaks, peaks, out=numpy.zeros(len(self.values)), where=peaks > 0)
+        trough = int(numpy.argmin(drawdowns))
+        peak = int(numpy.argmax(self.values[:trough + 1]))
+        return {"drawdown": float(drawdowns[trough]),
+                "peak": converter.ordinal_to_date(self.first_ordinal + peak),
+                "trough": converter.ordinal_to_date(self.first_ordinal + trough)}
+
+    def __validate(self, days, name):
+        if days < 1:
+            raise ValueError("The " + name + " must be at least one day.")
+
+    def __daily_returns(self):
+        previous = self.values[:-1]
+        changes = self.values[1:] - previous
+        return numpy.divide(changes, numpy.abs(previous), out=numpy.zeros(len(changes)), where=previous != 0)
@@ -1,9 +1,24 @@
-import requests
-
+from portfolio_creator.ledger_client import LedgerClient
 from utilities.constants import Constants
 
 
 class DataSource:
+    def __init__(self, url=Constants.DATA_URL, client=None):
+        self.client = client or LedgerClient(url)
 
     def get(self):
-        return requests.get(Constants.DATA_URL).text
+        return self.client.get()
+
+    def stream(self):
+        return self.client.stream()
+
+    def version(self):
+        return self.client.validators()
+
+    def assume_version(self, version):
+        self.client.assume_validators(version)
+
+    def get_since(self, cursor):
+        if cursor is None:
+            return self.get()
+        return self.client.get(params={"since": cursor})
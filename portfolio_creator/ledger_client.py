@@ -0,0 +1,84 @@
+import gzip
+
+from utilities.constants import Constants
+
+
+class LedgerClient:
+    def __init__(self, url=Constants.DATA_URL, timeout=Constants.REQUEST_TIMEOUT_SECONDS, compress_requests=False):
+        self.url = url
+        self.timeout = timeout
+        self.compress_requests = compress_requests
+        self.__session = None
+        self.__validators = {}
+
+    @property
+    def session(self):
+        if self.__session is None:
+            self.__session = self.__create_session()
+        return self.__session
+
+    def get(self, path="/", params=None):
+        url = self.url + path
+        key = self.__key(path, params)
+        response = self.session.get(url, params=params, headers=self.__conditional_headers(key), timeout=self.timeout)
+        if response.status_code == 304:
+            return None
+        response.raise_for_status()
+        self.__remember_validators(key, response)
+        return response.text
+
+    def stream(self, path="/", params=None):
+        url = self.url + path
+        key = self.__key(path, params)
+        response = self.session.get(url, params=params, headers=self.__conditional_headers(key), timeout=self.timeout,
+                                    stream=True)
+        if response.status_code == 304:
+            response.close()
+            return None
+        response.raise_for_status()
+        self.__remember_validators(key, response)
+        return response.iter_content(chunk_size=Constants.STREAM_CHUNK_SIZE)
+
+    def post(self, path, data):
+        headers = {"Content-Type": "application/json"}
+        if self.compress_requests:
+            data = gzip.compress(data.encode("utf-8"))
+            headers["Content-Encoding"] = "gzip"
+        return self.session.post(self.url + path, data=data, headers=headers, timeout=self.timeout)
+
+    def validators(self, path="/", params=None):
+        return self.__validators.get(self.__key(path, params))
+
+    def assume_validators(self, validators, path="/", params=None):
+        if validators is None:
+            self.__validators.pop(self.__key(path, params), None)
+        else:
+            self.__validators[self.__key(path, params)] = tuple(validators)
+
+    def __create_session(self):
+        import requests
+        from requests.adapters import HTTPAdapter
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=Constants.CONNECTION_POOL_SIZE)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers["Accept-Encoding"] = "gzip"
+        return session
+
+    def __key(self, path, params):
+        return self.url + path, tuple(sorted((params or {}).items()))
+
+    def __conditional_headers(self, key):
+        etag, last_modified = self.__validators.get(key, (None, None))
+        headers = {}
+        if etag is not None:
+            headers["If-None-Match"] = etag
+        if last_modified is not None:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def __remember_validators(self, key, response):
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag is not None or last_modified is not None:
+            self.__validators[key] = (etag, last_modified)
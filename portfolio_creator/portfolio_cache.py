@@ -0,0 +1,128 @@
+import json
+import os
+import struct
+
+import numpy
+
+from portfolio.account import Account
+from portfolio.portfolio import Portfolio
+from utilities.constants import Constants
+from valid_options.account_type import AccountType
+from valid_options.asset_class import AssetClass
+from valid_options.term import Term
+
+
+class PortfolioCache:
+    MAGIC = b"PORTFOLIO-CACHE\n"
+    FORMAT_VERSION = 1
+    ALIGNMENT = 8
+    BYTES_PER_SNAPSHOT = 20
+
+    def __init__(self, path=Constants.PORTFOLIO_CACHE_PATH):
+        self.path = path
+
+    def save(self, portfolio, version=None, cursor=None):
+        accounts = []
+        timestamps = []
+        ordinals = []
+        values = []
+        offset = 0
+        for account in portfolio.accounts:
+            account_timestamps, account_ordinals, account_values = account.columns()
+            accounts.append({"name": account.name(),
+                             "owner": account.owner(),
+                             "investment": account.investment(),
+                             "asset_class": account.asset_class(),
+                             "institution": account.institution(),
+                             "account_type": account.account_type(),
+                             "update_frequency": account.update_frequency(),
+                             "open_date": account.open_date(),
+                             "term": account.term(),
+                             "uuid": account.uuid(),
+                             "offset": offset,
+                             "length": len(account_timestamps)})
+            offset += len(account_timestamps)
+            timestamps.append(account_timestamps)
+            ordinals.append(account_ordinals)
+            values.append(account_values)
+        header = json.dumps({"format": PortfolioCache.FORMAT_VERSION,
+                             "version": version,
+                             "cursor": cursor,
+                             "count": offset,
+                             "accounts": accounts}).encode("utf-8")
+        header += b" " * (-len(header) % PortfolioCache.ALIGNMENT)
+        temporary_path = self.path + ".tmp"
+        with open(temporary_path, "wb") as cache_file:
+            cache_file.write(PortfolioCache.MAGIC)
+            cache_file.write(struct.pack("<Q", len(header)))
+            cache_file.write(header)
+            cache_file.write(self.__concatenate(timestamps, numpy.float64).tobytes())
+            cache_file.write(self.__concatenate(values, numpy.float64).tobytes())
+            cache_file.write(self.__concatenate(ordinals, numpy.int32).tobytes())
+        os.replace(temporary_path, self.path)
+
+    def load(self):
+        header, start = self.__read_header()
+        if header is None:
+            return None
+        count = header["count"]
+        try:
+            timestamps = self.__map(numpy.float64, start, count)
+            values = self.__map(numpy.float64, start + 8 * count, count)
+            ordinals = self.__map(numpy.int32, start + 16 * count, count)
+        except (ValueError, OSError):
+            return None
+        portfolio = Portfolio()
+        for metadata in header["accounts"]:
+            account = Account({"name": metadata["name"],
+                               "owner": metadata["owner"],
+                               "investment": metadata["investment"],
+                               "asset_class": AssetClass(metadata["asset_class"]),
+                               "institution": metadata["institution"],
+                               "account_type": AccountType(metadata["account_type"]),
+                               "update_frequency": metadata["update_frequency"],
+                               "open_date": metadata["open_date"],
+                               "term": Term(metadata["term"]),
+                               "uuid": metadata["uuid"]})
+            window = slice(metadata["offset"], metadata["offset"] + metadata["length"])
+            account.import_columns(timestamps[window], ordinals[window], values[window])
+            portfolio.import_account(account)
+        return portfolio
+
+    def version(self):
+        header, start = self.__read_header()
+        return None if header is None else header["version"]
+
+    def cursor(self):
+        header, start = self.__read_header()
+        return None if header is None else header["cursor"]
+
+    def __read_header(self):
+        if not os.path.exists(self.path):
+            return None, 0
+        try:
+            with open(self.path, "rb") as cache_file:
+                if cache_file.read(len(PortfolioCache.MAGIC)) != PortfolioCache.MAGIC:
+                    return None, 0
+                header_length = struct.unpack("<Q", cache_file.read(8))[0]
+                header = json.loads(cache_file.read(header_length).decode("utf-8"))
+            size = os.path.getsize(self.path)
+        except (ValueError, struct.error, OSError):
+            return None, 0
+        if not isinstance(header, dict) or header.get("format") != PortfolioCache.FORMAT_VERSION:
+            return None, 0
+        start = len(PortfolioCache.MAGIC) + 8 + header_length
+        count = header.get("count")
+        if not isinstance(count, int) or size != start + PortfolioCache.BYTES_PER_SNAPSHOT * count:
+            return None, 0
+        return header, start
+
+    def __map(self, dtype, offset, count):
+        if count == 0:
+            return numpy.empty(0, dtype=dtype)
+        return numpy.memmap(self.path, dtype=dtype, mode="r", offset=offset, shape=(count,))
+
+    def __concatenate(self, arrays, dtype):
+        if not arrays:
+            return numpy.empty(0, dtype=dtype)
+        return numpy.concatenate(arrays).astype(dtype)
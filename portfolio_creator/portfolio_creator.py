@@ -1,27 +1,130 @@
 import json
+import time
 
 from portfolio.portfolio import Portfolio
+from portfolio_creator.snapshot_stream import SnapshotStream
+from utilities.constants import Constants
+from utilities.epoch_date_converter import EpochDateConverter
 
 class PortfolioCreator:
+    def __init__(self):
+        self.timings = {}
+        self.cursor = None
 
     def create(self, data_source):
-        portfolio = Portfolio()
+        data_source.assume_version(None)
+        return self.create_if_modified(data_source, None)
+
+    def create_if_modified(self, data_source, portfolio):
+        start = time.perf_counter()
         data = data_source.get()
+        self.timings["fetch"] = time.perf_counter() - start
+        if data is None:
+            return portfolio
+        portfolio = Portfolio()
+        start = time.perf_counter()
         snapshots = json.loads(data)
-        for item in snapshots["snapshots"]:
-            portfolio.import_data({"timestamp": item["timestamp"],
-                                   "institution": item["institution"],
-                                   "name": item["account"],
-                                   "owner": item["owner"],
-                                   "investment": item["investment"],
-                                   "update_frequency": item["update_frequency"],
-                                   "account_type": self.__account_type(item),
-                                   "value": self.__value(item),
-                                   "asset_class": self.__asset_class(item),
-                                   "open_date": item["open_date"],
-                                   "term": self.__term(item)})
+        rows = [self.__row(item) for item in snapshots["snapshots"]]
+        self.timings["parse"] = time.perf_counter() - start
+        inserted, timings = portfolio.import_many(rows)
+        self.timings.update(timings)
+        self.__advance_cursor(rows)
+        return portfolio
+
+    def create_cached(self, data_source, cache):
+        start = time.perf_counter()
+        cached_portfolio = cache.load()
+        self.timings["load"] = time.perf_counter() - start
+        if cached_portfolio is not None:
+            data_source.assume_version(cache.version())
+            self.cursor = cache.cursor()
+        try:
+            portfolio = self.__create_streaming_if_modified(data_source, cached_portfolio, Constants.STREAM_BATCH_SIZE)
+        except OSError:
+            if cached_portfolio is None:
+                raise
+            return cached_portfolio
+        if portfolio is not cached_portfolio:
+            cache.save(portfolio, data_source.version(), self.cursor)
         return portfolio
 
+    def create_streaming(self, data_source, batch_size=Constants.STREAM_BATCH_SIZE):
+        data_source.assume_version(None)
+        return self.__create_streaming_if_modified(data_source, None, batch_size)
+
+    def update(self, portfolio, delta):
+        if delta is None:
+            return 0
+        rows = [self.__row(item) for item in json.loads(delta)["snapshots"]]
+        inserted, self.timings = portfolio.import_many(rows, skip_existing=True)
+        self.__advance_cursor(rows)
+        return inserted
+
+    def append_snapshot(self, portfolio, item):
+        row = self.__row(item)
+        accounts = portfolio.accounts_matching(self.__account_filter(item))
+        if accounts:
+            portfolio.append_snapshot(accounts[0], row["timestamp"], row["value"])
+        else:
+            portfolio.import_data(row)
+
+    def validate_snapshot(self, item):
+        EpochDateConverter().date_to_epoch(self.__row(item)["timestamp"])
+
+    def update_frequency(self, portfolio, item):
+        for account in portfolio.accounts_matching(self.__account_filter(item)):
+            portfolio.update_frequency(account, item["frequency"])
+
+    def update_open_date(self, portfolio, item):
+        for account in portfolio.accounts_matching(self.__account_filter(item)):
+            portfolio.update_open_date(account, item["open_date"])
+
+    def __create_streaming_if_modified(self, data_source, portfolio, batch_size):
+        chunks = data_source.stream()
+        if chunks is None:
+            return portfolio
+        portfolio = Portfolio()
+        rows = []
+        for item in SnapshotStream(chunks):
+            rows.append(self.__row(item))
+            if len(rows) >= batch_size:
+                self.__import_batch(portfolio, rows)
+                rows = []
+        self.__import_batch(portfolio, rows)
+        return portfolio
+
+    def __import_batch(self, portfolio, rows):
+        inserted, timings = portfolio.import_many(rows)
+        for stage, duration in timings.items():
+            self.timings[stage] = self.timings.get(stage, 0) + duration
+        self.__advance_cursor(rows)
+
+    def __advance_cursor(self, rows):
+        converter = EpochDateConverter()
+        for row in rows:
+            if self.cursor is None or converter.date_to_ordinal(row["timestamp"]) > converter.date_to_ordinal(self.cursor):
+                self.cursor = row["timestamp"]
+
+    def __account_filter(self, item):
+        return {"name": item["account"],
+                "institution": item["institution"],
+                "owner": item["owner"],
+                "investment": item["investment"],
+                "account_type": self.__account_type(item)}
+
+    def __row(self, item):
+        return {"timestamp": item["timestamp"],
+                "institution": item["institution"],
+                "name": item["account"],
+                "owner": item["owner"],
+                "investment": item["investment"],
+                "update_frequency": item.get("update_frequency"),
+                "account_type": self.__account_type(item),
+                "value": self.__value(item),
+                "asset_class": self.__asset_class(item),
+                "open_date": item.get("open_date"),
+                "term": self.__term(item)}
+
     def __account_type(self, account):
         return "ASSET" if account["asset"] else "LIABILITY"
 
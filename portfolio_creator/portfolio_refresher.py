@@ -0,0 +1,173 @@
+import threading
+import time
+
+from portfolio_creator.portfolio_creator import PortfolioCreator
+from utilities.constants import Constants
+
+
+class PortfolioRefresher:
+    def __init__(self, data_source, portfolio=None, cache=None, interval=Constants.REFRESH_INTERVAL_SECONDS,
+                 loader=None):
+        self.data_source = data_source
+        self.cache = cache
+        self.interval = interval
+        self.loader = loader or self.__load
+        self.__portfolio = portfolio
+        self.__load_time = None
+        self.__lock = threading.Lock()
+        self.__load_lock = threading.Lock()
+        self.__stopped = threading.Event()
+        self.__thread = None
+        self.__generation = 0
+        self.__refreshing = False
+        self.__last_refreshed = time.time()
+        self.__last_error = None
+        self.__cursor = None
+
+    def portfolio(self):
+        portfolio = self.__portfolio
+        if portfolio is None:
+            with self.__load_lock:
+                if self.__portfolio is None:
+                    self.__warm_up()
+                portfolio = self.__portfolio
+        return portfolio
+
+    def ready(self):
+        portfolio = self.__portfolio
+        if portfolio is None:
+            return {"ready": False, "last_error": self.__last_error}
+        return {"ready": True,
+                "load_time": self.__load_time,
+                "accounts": len(portfolio.accounts),
+                "snapshots": sum(len(account.columns()[0]) for account in portfolio.accounts)}
+
+    def start(self):
+        if self.__thread is None:
+            self.__stopped.clear()
+            self.__thread = threading.Thread(target=self.__run, name="portfolio-refresher", daemon=True)
+            self.__thread.start()
+        return self
+
+    def stop(self):
+        self.__stopped.set()
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
+
+    def refresh(self):
+        loading = self.__portfolio is None
+        try:
+            self.portfolio()
+        except Exception:
+            return False
+        if loading:
+            return False
+        with self.__lock:
+            self.__refreshing = True
+        try:
+            refreshed = self.__sync()
+        except Exception as error:
+            with self.__lock:
+                self.__refreshing = False
+                self.__last_error = repr(error)
+            return False
+        with self.__lock:
+            self.__refreshing = False
+            self.__last_error = None
+        return refreshed
+
+    def apply(self, change):
+        self.portfolio()
+        with self.__lock:
+            portfolio = self.__portfolio.copy()
+            change(portfolio)
+            self.__portfolio = portfolio
+            self.__generation += 1
+
+    def status(self):
+        with self.__lock:
+            age = time.time() - self.__last_refreshed
+            return {"interval": self.interval,
+                    "last_refreshed": self.__last_refreshed,
+                    "age": age,
+                    "stale": age > 2 * self.interval,
+                    "refreshing": self.__refreshing,
+                    "generation": self.__generation,
+                    "last_error": self.__last_error}
+
+    def __warm_up(self):
+        start = time.perf_counter()
+        try:
+            portfolio = self.loader()
+        except Exception as error:
+            self.__last_error = repr(error)
+            raise
+        with self.__lock:
+            self.__portfolio = portfolio
+            self.__load_time = time.perf_counter() - start
+            self.__last_refreshed = time.time()
+            self.__last_error = None
+
+    def __load(self):
+        creator = PortfolioCreator()
+        if self.cache is None:
+            portfolio = creator.create_streaming(self.data_source)
+        else:
+            portfolio = creator.create_cached(self.data_source, self.cache)
+        self.__cursor = creator.cursor
+        return portfolio
+
+    def __sync(self):
+        with self.__lock:
+            cursor = self.__cursor
+        try:
+            delta = self.data_source.get_since(cursor)
+        except Exception:
+            return self.__rebuild()
+        while True:
+            with self.__lock:
+                current = self.__portfolio
+                generation = self.__generation
+            creator = PortfolioCreator()
+            creator.cursor = cursor
+            portfolio = current
+            if delta is not None:
+                portfolio = current.copy()
+                if creator.update(portfolio, delta) == 0:
+                    portfolio = current
+            if self.__publish(current, portfolio, generation, creator):
+                return portfolio is not current
+
+    def __rebuild(self):
+        with self.__lock:
+            current = self.__portfolio
+            generation = self.__generation
+            cursor = self.__cursor
+        version = self.data_source.version()
+        creator = PortfolioCreator()
+        creator.cursor = cursor
+        portfolio = creator.create_if_modified(self.data_source, current)
+        if self.__publish(current, portfolio, generation, creator):
+            return portfolio is not current
+        self.data_source.assume_version(version)
+        return False
+
+    def __publish(self, current, portfolio, generation, creator):
+        with self.__lock:
+            if self.__generation != generation:
+                return False
+            self.__last_refreshed = time.time()
+            self.__cursor = creator.cursor
+            if portfolio is current:
+                return True
+            self.__portfolio = portfolio
+            self.__generation += 1
+        if self.cache is not None:
+            self.cache.save(portfolio, self.data_source.version(), creator.cursor)
+        return True
+
+    def __run(self):
+        self.refresh()
+        while not self.__stopped.wait(self.interval):
+            self.refresh()
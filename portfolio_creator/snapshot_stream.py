@@ -0,0 +1,84 @@
+import codecs
+import json
+
+
+class SnapshotStream:
+    NUMBER_CHARACTERS = "0123456789.eE+-"
+
+    def __init__(self, chunks, key="snapshots"):
+        self.__chunks = iter(chunks)
+        self.__key = key
+        self.__decoder = json.JSONDecoder()
+        self.__text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self.__buffer = ""
+        self.__index = 0
+        self.__exhausted = False
+
+    def __iter__(self):
+        self.__expect("{")
+        while not self.__consume("}"):
+            self.__consume(",")
+            key = self.__value()
+            self.__expect(":")
+            if key == self.__key:
+                yield from self.__elements()
+            else:
+                self.__value()
+
+    def __elements(self):
+        self.__expect("[")
+        while not self.__consume("]"):
+            self.__consume(",")
+            yield self.__value()
+
+    def __value(self):
+        while True:
+            self.__skip_whitespace()
+            try:
+                value, end = self.__decoder.raw_decode(self.__buffer, self.__index)
+            except json.JSONDecodeError:
+                if self.__read():
+                    continue
+                raise
+            if self.__is_complete(end) or not self.__read():
+                self.__index = end
+                self.__compact()
+                return value
+
+    def __is_complete(self, end):
+        return end < len(self.__buffer) and self.__buffer[end] not in SnapshotStream.NUMBER_CHARACTERS
+
+    def __expect(self, token):
+        if not self.__consume(token):
+            raise ValueError("Expected " + token + " in the snapshot stream.")
+
+    def __consume(self, token):
+        self.__skip_whitespace()
+        if self.__buffer.startswith(token, self.__index):
+            self.__index += len(token)
+            return True
+        return False
+
+    def __skip_whitespace(self):
+        while True:
+            while self.__index < len(self.__buffer) and self.__buffer[self.__index].isspace():
+                self.__index += 1
+            if self.__index < len(self.__buffer) or not self.__read():
+                return
+
+    def __read(self):
+        if self.__exhausted:
+            return False
+        for chunk in self.__chunks:
+            text = self.__text_decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+            if text:
+                self.__buffer += text
+                return True
+        self.__exhausted = True
+        self.__buffer += self.__text_decoder.decode(b"", final=True)
+        return False
+
+    def __compact(self):
+        if self.__index > 65536:
+            self.__buffer = self.__buffer[self.__index:]
+            self.__index = 0
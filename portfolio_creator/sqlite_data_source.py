@@ -0,0 +1,222 @@
+import json
+import sqlite3
+import threading
+
+import numpy
+
+from utilities.constants import Constants
+from utilities.epoch_date_converter import EpochDateConverter
+
+
+class SqliteDataSource:
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS accounts (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            owner TEXT NOT NULL,
+            investment TEXT,
+            institution TEXT,
+            asset INTEGER NOT NULL,
+            asset_class TEXT,
+            update_frequency INTEGER,
+            open_date TEXT,
+            term TEXT
+        );
+        CREATE TABLE IF NOT EXISTS snapshots (
+            id INTEGER PRIMARY KEY,
+            account_id INTEGER NOT NULL REFERENCES accounts(id),
+            timestamp TEXT NOT NULL,
+            value INTEGER NOT NULL
+        );
+        CREATE UNIQUE INDEX IF NOT EXISTS snapshots_by_account_timestamp_and_value
+            ON snapshots(account_id, timestamp, value);
+        CREATE INDEX IF NOT EXISTS snapshots_by_timestamp ON snapshots(timestamp);
+    """
+    UNIQUE_SNAPSHOTS_INDEX = "snapshots_by_account_timestamp_and_value"
+    REMOVE_DUPLICATE_SNAPSHOTS = """
+        DELETE FROM snapshots WHERE id NOT IN (SELECT MIN(id) FROM snapshots GROUP BY account_id, timestamp, value)
+    """
+    IDENTITY_COLUMNS = ["name", "owner", "investment", "institution", "asset", "asset_class", "open_date", "term"]
+    LATEST_SNAPSHOT = """
+        SELECT id FROM snapshots
+        WHERE account_id = accounts.id AND timestamp <= ?
+        ORDER BY timestamp DESC, id DESC LIMIT 1
+    """
+    ALL_ACCOUNTS = "1"
+    ASSETS = "accounts.asset = 1"
+    LIABILITIES = "accounts.asset = 0"
+
+    def __init__(self, path=Constants.SQLITE_PATH):
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.__lock = threading.RLock()
+        self.__remove_duplicate_snapshots()
+        self.connection.executescript(SqliteDataSource.SCHEMA)
+        self.converter = EpochDateConverter()
+        self.__assumed_version = None
+
+    def import_json(self, data):
+        return self.import_snapshots(json.loads(data)["snapshots"])
+
+    def import_snapshots(self, items):
+        with self.__lock, self.connection:
+            accounts = self.__account_ids()
+            rows = []
+            changes = self.connection.total_changes
+            for item in items:
+                key = self.__identity(item)
+                account_id = accounts.get(key)
+                if account_id is None:
+                    account_id = self.connection.execute(
+                        "INSERT INTO accounts (name, owner, investment, institution, asset, asset_class, open_date, "
+                        "term, update_frequency) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        key + (item.get("update_frequency"),)).lastrowid
+                    accounts[key] = account_id
+                elif item.get("update_frequency") is not None:
+                    self.connection.execute("UPDATE accounts SET update_frequency = ? "
+                                            "WHERE id = ? AND update_frequency IS NOT ?",
+                                            (item["update_frequency"], account_id, item["update_frequency"]))
+                rows.append((account_id, self.__normalize(item["timestamp"]), int(round(float(item["value"])))))
+            snapshot_changes = self.connection.total_changes
+            self.connection.executemany("INSERT OR IGNORE INTO snapshots (account_id, timestamp, value) "
+                                        "VALUES (?, ?, ?)", rows)
+            inserted = self.connection.total_changes - snapshot_changes
+            if self.connection.total_changes > changes:
+                self.__bump_version()
+        return inserted
+
+    def get(self):
+        return self.__if_modified("", ())
+
+    def stream(self):
+        data = self.get()
+        if data is None:
+            return None
+        return [data.encode("utf-8")]
+
+    def get_since(self, cursor):
+        if cursor is None:
+            return self.get()
+        return self.__if_modified("WHERE snapshots.timestamp >= ?", (self.__normalize(cursor),))
+
+    def version(self):
+        return self.__rows("PRAGMA user_version")[0][0]
+
+    def assume_version(self, version):
+        self.__assumed_version = version
+
+    def total_value(self, date=None):
+        return self.__value_on(date, SqliteDataSource.ALL_ACCOUNTS)
+
+    def assets_value(self, date=None):
+        return self.__value_on(date, SqliteDataSource.ASSETS)
+
+    def liabilities_value(self, date=None):
+        return -self.__value_on(date, SqliteDataSource.LIABILITIES)
+
+    def values_between(self, start, end):
+        return self.__values_between(start, end, SqliteDataSource.ALL_ACCOUNTS)
+
+    def assets_values_between(self, start, end):
+        return self.__values_between(start, end, SqliteDataSource.ASSETS)
+
+    def liabilities_values_between(self, start, end):
+        return [-value for value in self.__values_between(start, end, SqliteDataSource.LIABILITIES)]
+
+    def __value_on(self, date, condition):
+        return sum(self.__signed(asset, value) for asset, value in self.__latest_values(date, condition).values())
+
+    def __values_between(self, start, end, condition):
+        first = self.converter.date_to_ordinal(start)
+        last = self.converter.date_to_ordinal(end)
+        if last < first:
+            return []
+        current = self.__latest_values(start, condition)
+        opening = sum(self.__signed(asset, value) for asset, value in current.values())
+        changes = self.__rows(
+            "SELECT snapshots.account_id, snapshots.timestamp, accounts.asset, snapshots.value "
+            "FROM snapshots JOIN accounts ON accounts.id = snapshots.account_id "
+            "WHERE snapshots.timestamp > ? AND snapshots.timestamp <= ? AND " + condition +
+            " ORDER BY snapshots.timestamp, snapshots.id",
+            (self.__normalize(start), self.__normalize(end)))
+        offsets = []
+        deltas = []
+        for account_id, timestamp, asset, value in changes:
+            previous = current.get(account_id, (asset, 0))[1]
+            offsets.append(self.converter.date_to_ordinal(timestamp) - first)
+            deltas.append(self.__signed(asset, value - previous))
+            current[account_id] = (asset, value)
+        changes_per_day = numpy.bincount(numpy.asarray(offsets, dtype=int), weights=deltas, minlength=last - first + 1)
+        return (opening + numpy.cumsum(changes_per_day)).tolist()
+
+    def __latest_values(self, date, condition):
+        rows = self.__rows(
+            "SELECT accounts.id, accounts.asset, snapshots.value FROM accounts "
+            "JOIN snapshots ON snapshots.id = (" + SqliteDataSource.LATEST_SNAPSHOT + ") WHERE " + condition,
+            (self.__normalize(date),))
+        return {account_id: (asset, value) for account_id, asset, value in rows}
+
+    def __signed(self, asset, value):
+        return (value if asset else -value) / 100
+
+    def __if_modified(self, condition, parameters):
+        with self.__lock:
+            version = self.version()
+            if self.__assumed_version == version:
+                return None
+            self.__assumed_version = version
+            return self.__snapshots_json(condition, parameters)
+
+    def __snapshots_json(self, condition, parameters):
+        rows = self.__rows(
+            "SELECT snapshots.timestamp, accounts.institution, accounts.name, accounts.owner, accounts.investment, "
+            "accounts.asset, snapshots.value, accounts.asset_class, accounts.update_frequency, accounts.open_date, "
+            "accounts.term FROM snapshots JOIN accounts ON accounts.id = snapshots.account_id " + condition +
+            " ORDER BY snapshots.id", parameters)
+        return json.dumps({"snapshots": [self.__snapshot(row) for row in rows]})
+
+    def __snapshot(self, row):
+        timestamp, institution, name, owner, investment, asset, value, asset_class, update_frequency, open_date, term = row
+        snapshot = {"timestamp": timestamp,
+                    "institution": institution,
+                    "account": name,
+                    "owner": owner,
+                    "investment": investment,
+                    "asset": bool(asset),
+                    "value": value,
+                    "update_frequency": update_frequency,
+                    "open_date": open_date,
+                    "term": term}
+        if asset_class is not None:
+            snapshot["asset_class"] = asset_class
+        return snapshot
+
+    def __account_ids(self):
+        rows = self.__rows("SELECT id, " + ", ".join(SqliteDataSource.IDENTITY_COLUMNS) + " FROM accounts")
+        return {tuple(row[1:]): row[0] for row in rows}
+
+    def __identity(self, item):
+        return (item["account"],
+                item["owner"],
+                item.get("investment"),
+                item.get("institution"),
+                1 if item["asset"] else 0,
+                item.get("asset_class"),
+                item.get("open_date"),
+                item.get("term"))
+
+    def __rows(self, sql, parameters=()):
+        with self.__lock:
+            return self.connection.execute(sql, parameters).fetchall()
+
+    def __normalize(self, date):
+        return self.converter.ordinal_to_date(self.converter.date_to_ordinal(date))
+
+    def __remove_duplicate_snapshots(self):
+        names = set(row[0] for row in self.__rows("SELECT name FROM sqlite_master WHERE name IN (?, ?)",
+                                                  ("snapshots", SqliteDataSource.UNIQUE_SNAPSHOTS_INDEX)))
+        if names == {"snapshots"}:
+            with self.connection:
+                self.connection.execute(SqliteDataSource.REMOVE_DUPLICATE_SNAPSHOTS)
+
+    def __bump_version(self):
+        self.connection.execute("PRAGMA user_version = " + str(self.version() + 1))
@@ -0,0 +1,25 @@
+import numpy
+
+
+class Downsampler:
+    @staticmethod
+    def largest_triangle_three_buckets(xs, ys, threshold):
+        if threshold < 3:
+            raise ValueError("At least three points are needed to downsample a series.")
+        xs = numpy.asarray(xs, dtype=float)
+        ys = numpy.asarray(ys, dtype=float)
+        if len(xs) <= threshold:
+            return numpy.arange(len(xs))
+        edges = numpy.linspace(1, len(xs) - 1, threshold - 1).astype(int)
+        selected = [0]
+        for bucket in range(threshold - 2):
+            start, end = edges[bucket], edges[bucket + 1]
+            next_start, next_end = end, edges[bucket + 2] if bucket + 2 < len(edges) else len(xs)
+            average_x = xs[next_start:next_end].mean()
+            average_y = ys[next_start:next_end].mean()
+            previous = selected[-1]
+            areas = numpy.abs((xs[previous] - average_x) * (ys[start:end] - ys[previous]) -
+                              (xs[previous] - xs[start:end]) * (average_y - ys[previous]))
+            selected.append(start + int(numpy.argmax(areas)))
+        selected.append(len(xs) - 1)
+        return numpy.array(selected)
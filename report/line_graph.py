@@ -1,20 +1,117 @@
 import datetime
+from collections import OrderedDict
 
-from utilities.constants import Constants
+import numpy
+
+from report.downsampler import Downsampler
 from utilities.epoch_date_converter import EpochDateConverter
 
 
 class LineGraph:
+    RESOLUTIONS = ["daily", "weekly", "monthly"]
+    BREAKDOWNS = ["asset_class", "owner", "institution"]
+    DAYS_PER_WEEK = 7
+
     def __init__(self, portfolio):
         self.__portfolio = portfolio
 
-    def net_worth_vs_time(self, start_date, end_date):
-        current_epoch = EpochDateConverter().date_to_epoch(start_date)
-        output = []
-        while current_epoch <= EpochDateConverter().date_to_epoch(end_date):
-            formatted_date = EpochDateConverter().epoch_to_date(current_epoch)
-            output.append({"series": "net-worth",
-                           "date": datetime.datetime.fromtimestamp(current_epoch).strftime("%Y-%m-%d"),
-                           "value": self.__portfolio.total_value(formatted_date)})
-            current_epoch += Constants.SECONDS_PER_DAY
+    def net_worth_vs_time(self, start_date, end_date, resolution="daily", max_points=None):
+        converter = EpochDateConverter()
+        ordinals, values = self.__net_worth_series(start_date, end_date, resolution, max_points)
+        return [{"series": "net-worth", "date": converter.ordinal_to_date(ordinal), "value": value}
+                for ordinal, value in zip(ordinals.tolist(), values.tolist())]
+
+    def net_worth_columns(self, start_date, end_date, resolution="daily", max_points=None):
+        ordinals, values = self.__net_worth_series(start_date, end_date, resolution, max_points)
+        columns = {"series": "net-worth", "values": values}
+        columns.update(self.__spacing(ordinals, start_date))
+        return columns
+
+    def series(self, start_date, end_date, breakdown=None, resolution="daily"):
+        breakdowns = self.__validate_breakdowns(breakdown)
+        ordinals = self.__sample_ordinals(None, start_date, end_date, resolution, None)
+        values = self.__portfolio.series_on(ordinals, self.__series_weights(breakdowns))
+        output = {"series": values}
+        output.update(self.__spacing(ordinals, start_date))
         return output
+
+    def __spacing(self, ordinals, start_date):
+        converter = EpochDateConverter()
+        start = converter.date_to_ordinal(start_date)
+        offsets = (ordinals - start).astype(numpy.int32)
+        steps = numpy.unique(numpy.diff(offsets))
+        if offsets.size > 0 and offsets[0] == 0 and steps.size <= 1:
+            return {"start": converter.ordinal_to_date(start), "step": int(steps[0]) if steps.size == 1 else 1}
+        return {"start": converter.ordinal_to_date(start), "offsets": offsets}
+
+    def __series_weights(self, breakdowns):
+        non_mortgage_liabilities = set(self.__portfolio.non_mortgage_liabilities())
+        weights = OrderedDict()
+        weights["assets"] = lambda account: 1 if account.account_type() == "ASSET" else 0
+        weights["liabilities"] = lambda account: 1 if account.account_type() == "LIABILITY" else 0
+        weights["net-worth"] = self.__sign
+        weights["liabilities-without-mortgage"] = lambda account: 1 if account in non_mortgage_liabilities else 0
+        for dimension in breakdowns:
+            groups = set(getattr(account, dimension)() for account in self.__portfolio.accounts)
+            for group in sorted(groups, key=str):
+                weights[dimension + ":" + str(group)] = self.__group_weights(dimension, group)
+        return weights
+
+    def __group_weights(self, dimension, group):
+        return lambda account: self.__sign(account) if getattr(account, dimension)() == group else 0
+
+    def __sign(self, account):
+        return 1 if account.account_type() == "ASSET" else -1
+
+    def __validate_breakdowns(self, breakdown):
+        breakdowns = [] if breakdown is None else [breakdown] if isinstance(breakdown, str) else list(breakdown)
+        for dimension in breakdowns:
+            if dimension not in LineGraph.BREAKDOWNS:
+                raise ValueError("The breakdown must be one of " + ", ".join(LineGraph.BREAKDOWNS) + ".")
+        return breakdowns
+
+    def __net_worth_series(self, start_date, end_date, resolution, max_points):
+        timeline = self.__portfolio.net_worth_timeline()
+        ordinals = self.__sample_ordinals(timeline, start_date, end_date, resolution, max_points)
+        if len(ordinals) > 0 and len(ordinals) == ordinals[-1] - ordinals[0] + 1:
+            values = self.__portfolio.net_worth_between(start_date, end_date)
+        else:
+            values = self.__portfolio.net_worth_on(ordinals)
+        if max_points is not None:
+            selected = Downsampler.largest_triangle_three_buckets(ordinals, values, max_points)
+            ordinals, values = ordinals[selected], values[selected]
+        return ordinals, values
+
+    def __sample_ordinals(self, timeline, start_date, end_date, resolution, max_points):
+        if resolution not in LineGraph.RESOLUTIONS:
+            raise ValueError("The resolution must be one of " + ", ".join(LineGraph.RESOLUTIONS) + ".")
+        converter = EpochDateConverter()
+        start = converter.date_to_ordinal(start_date)
+        end = converter.date_to_ordinal(end_date)
+        if end < start:
+            return numpy.empty(0, dtype=numpy.int32)
+        if resolution == "weekly":
+            return self.__with_end(numpy.arange(start, end + 1, LineGraph.DAYS_PER_WEEK, dtype=numpy.int32), end)
+        if resolution == "monthly":
+            return self.__with_end(self.__month_starts(start, end), end)
+        if max_points is not None and end - start + 1 > max_points:
+            return self.__step_corners(timeline.change_ordinals(start, end), start, end)
+        return numpy.arange(start, end + 1, dtype=numpy.int32)
+
+    def __month_starts(self, start, end):
+        month = datetime.date.fromordinal(start).replace(day=1)
+        ordinals = [start]
+        while True:
+            month = (month + datetime.timedelta(days=32)).replace(day=1)
+            if month.toordinal() > end:
+                return numpy.array(ordinals, dtype=numpy.int32)
+            ordinals.append(month.toordinal())
+
+    def __step_corners(self, changes, start, end):
+        corners = numpy.concatenate(([start], changes - 1, changes, [end])).astype(numpy.int32)
+        return numpy.unique(corners[(corners >= start) & (corners <= end)])
+
+    def __with_end(self, ordinals, end):
+        if ordinals[-1] == end:
+            return ordinals
+        return numpy.append(ordinals, numpy.int32(end))
@@ -1,12 +1,14 @@
 import csv
+import sys
 import matplotlib.pyplot as plt
 
+from portfolio_creator.portfolio_cache import PortfolioCache
 from portfolio_creator.portfolio_creator import PortfolioCreator
 from portfolio_creator.data_source import DataSource
 from utilities.presenter import Presenter
 
-portfolio = PortfolioCreator().create(DataSource())
-unsorted_data = portfolio.percentages()
+portfolio = PortfolioCreator().create_cached(DataSource(), PortfolioCache())
+unsorted_data = portfolio.percentages(sys.argv[1] if len(sys.argv) > 1 else None)
 percentages = {}
 
 sorted_names = sorted(unsorted_data, key=unsorted_data.__getitem__)
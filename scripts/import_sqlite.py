@@ -0,0 +1,5 @@
+from portfolio_creator.data_source import DataSource
+from portfolio_creator.sqlite_data_source import SqliteDataSource
+
+count = SqliteDataSource().import_json(DataSource().get())
+print("Imported " + str(count) + " snapshots")
@@ -1,8 +1,9 @@
 import matplotlib.pyplot as plt
 from portfolio_creator.data_source import DataSource
+from portfolio_creator.portfolio_cache import PortfolioCache
 from portfolio_creator.portfolio_creator import PortfolioCreator
 
-portfolio = PortfolioCreator().create(DataSource())
+portfolio = PortfolioCreator().create_cached(DataSource(), PortfolioCache())
 unsorted_data = portfolio.asset_classes()
 asset_classes = {}
 
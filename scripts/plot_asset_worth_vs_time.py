@@ -4,13 +4,14 @@ from pylab import plot, xlabel, ylabel, title, show
 
 from portfolio.account_builder import AccountBuilder
 from portfolio_creator.data_source import DataSource
+from portfolio_creator.portfolio_cache import PortfolioCache
 from portfolio_creator.portfolio_creator import PortfolioCreator
 from utilities.constants import Constants
 from utilities.epoch_date_converter import EpochDateConverter
 from valid_options.account_type import AccountType
 from valid_options.asset_class import AssetClass
 
-portfolio = PortfolioCreator().create(DataSource())
+portfolio = PortfolioCreator().create_cached(DataSource(), PortfolioCache())
 separator = "=>"
 default_start_date = "2018-01-01"
 
@@ -42,39 +43,32 @@ if account is None:
     print("No account found")
     exit(1)
 
-if account.open_date is None:
-    snapshots = account.history.snapshots
-    start_epoch = snapshots[0].timestamp
+snapshot_times, snapshot_ordinals, snapshot_values = account.columns()
+
+if account.open_date() is None:
+    start_epoch = snapshot_times[0]
 else:
-    start_epoch = EpochDateConverter().date_to_epoch(account.open_date)
+    start_epoch = EpochDateConverter().date_to_epoch(account.open_date())
 end_epoch = EpochDateConverter().date_to_epoch()
 number_of_seconds = end_epoch - start_epoch
 number_of_days = int(number_of_seconds / Constants.SECONDS_PER_DAY)
 
-times = []
-owners_equity = []
-
-for day in range(0, number_of_days):
-    historical_time = EpochDateConverter().date_to_epoch() - day * Constants.SECONDS_PER_DAY
-    times.append(datetime.datetime.fromtimestamp(historical_time))
-    owners_equity.append(account.value(historical_time))
+current_epoch = EpochDateConverter().date_to_epoch()
+historical_times = [current_epoch - day * Constants.SECONDS_PER_DAY for day in range(0, number_of_days)]
+times = [datetime.datetime.fromtimestamp(historical_time) for historical_time in historical_times]
+owners_equity = account.values_at(historical_times)
 
 plot(times, owners_equity)
 
-times = []
-owners_equity = []
-
-for snapshot in account.history.snapshots:
-    times.append(datetime.datetime.fromtimestamp(snapshot.timestamp))
-    owners_equity.append(snapshot.value)
+times = [datetime.datetime.fromtimestamp(snapshot_time) for snapshot_time in snapshot_times]
 
-plot(times, owners_equity, 'o')
+plot(times, snapshot_values, 'o')
 
 times = []
 owners_equity = []
 
-if account.open_date is not None:
-    times.append(datetime.datetime.fromtimestamp(EpochDateConverter().date_to_epoch(account.open_date)))
+if account.open_date() is not None:
+    times.append(datetime.datetime.fromtimestamp(EpochDateConverter().date_to_epoch(account.open_date())))
     owners_equity.append(0)
 
 plot(times, owners_equity, 'x')
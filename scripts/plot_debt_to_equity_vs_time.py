@@ -2,23 +2,22 @@ import datetime
 
 from portfolio_analysis.portfolio_analyzer import PortfolioAnalyzer
 from portfolio_creator.data_source import DataSource
+from portfolio_creator.portfolio_cache import PortfolioCache
 from portfolio_creator.portfolio_creator import PortfolioCreator
 from pylab import plot, xlabel, ylabel, title, show
 from utilities.constants import Constants
 from utilities.epoch_date_converter import EpochDateConverter
 
-portfolio = PortfolioCreator().create(DataSource())
+portfolio = PortfolioCreator().create_cached(DataSource(), PortfolioCache())
 analyzer = PortfolioAnalyzer(portfolio)
 number_of_days = round(Constants.DAYS_PER_YEAR * 0.5)
 
-times = []
-debt_equity_ratio = []
-
-for day in range(0, number_of_days):
-    historical_time = EpochDateConverter().date_to_epoch() - day * Constants.SECONDS_PER_DAY
-    formatted_date = EpochDateConverter().epoch_to_date(historical_time)
-    times.append(datetime.datetime.fromtimestamp(historical_time))
-    debt_equity_ratio.append(analyzer.debt_to_equity(formatted_date))
+converter = EpochDateConverter()
+last_day = converter.date_to_ordinal()
+first_day = last_day - number_of_days + 1
+debt_equity_ratio = analyzer.debt_to_equity_series(converter.ordinal_to_date(first_day),
+                                                   converter.ordinal_to_date(last_day))
+times = [datetime.date.fromordinal(first_day + index) for index in range(number_of_days)]
 
 plot(times, debt_equity_ratio)
 xlabel('Date')
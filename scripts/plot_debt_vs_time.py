@@ -1,24 +1,21 @@
 import datetime
 
-from portfolio_analysis.portfolio_analyzer import PortfolioAnalyzer
 from portfolio_creator.data_source import DataSource
+from portfolio_creator.portfolio_cache import PortfolioCache
 from portfolio_creator.portfolio_creator import PortfolioCreator
 from pylab import plot, xlabel, ylabel, title, show
+from report.line_graph import LineGraph
 from utilities.constants import Constants
 from utilities.epoch_date_converter import EpochDateConverter
 
-portfolio = PortfolioCreator().create(DataSource())
-analyzer = PortfolioAnalyzer(portfolio)
-number_of_days = round(Constants.DAYS_PER_YEAR)
+portfolio = PortfolioCreator().create_cached(DataSource(), PortfolioCache())
 
-times = []
-debt = []
-
-for day in range(0, number_of_days):
-    historical_time = EpochDateConverter().date_to_epoch() - day * Constants.SECONDS_PER_DAY
-    formatted_date = EpochDateConverter().epoch_to_date(historical_time)
-    times.append(datetime.datetime.fromtimestamp(historical_time))
-    debt.append(portfolio.liabilities_without_mortgage(formatted_date))
+converter = EpochDateConverter()
+last_day = converter.date_to_ordinal()
+first_day = last_day - Constants.DAYS_PER_YEAR + 1
+data = LineGraph(portfolio).series(converter.ordinal_to_date(first_day), converter.ordinal_to_date(last_day))
+debt = data["series"]["liabilities-without-mortgage"]
+times = [datetime.date.fromordinal(first_day + index) for index in range(len(debt))]
 
 plot(times, debt)
 xlabel('Date')
@@ -51,3 +51,10 @@ class FormFormatterTestCase(unittest.TestCase):
         output_data = {'account': 'account', 'institution': 'institution', 'owner': 'owner', 'investment': 'investment',
                        'asset': False, 'value': 0, 'timestamp': 'some date'}
         self.assertEqual(self.formatter.format(input_data), output_data)
+
+    def test_it_adds_a_timestamp_to_the_data_if_it_is_empty(self):
+        input_data = {'account': 'account', 'institution': 'institution', 'owner': 'owner', 'investment': 'investment',
+                      'asset': False, 'value': 0, 'timestamp': ''}
+        output_data = {'account': 'account', 'institution': 'institution', 'owner': 'owner', 'investment': 'investment',
+                       'asset': False, 'value': 0, 'timestamp': 'some date'}
+        self.assertEqual(self.formatter.format(input_data), output_data)
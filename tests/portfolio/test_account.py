@@ -118,6 +118,43 @@ class AssetTestCase(unittest.TestCase):
         value = self.asset.value(epoch)
         self.assertEqual(value, 100)
 
+    def test_it_returns_the_values_at_many_query_times(self):
+        timestamp = EpochDateConverter().date_to_epoch("2015-12-12")
+        self.asset.import_snapshot(timestamp, 100)
+        self.asset.import_snapshot(timestamp + 50, 200)
+        values = self.asset.values_at([timestamp - 1, timestamp, timestamp + 49, timestamp + 50, timestamp + 1000])
+        self.assertEqual(list(values), [0, 100, 100, 200, 200])
+
+    def test_it_returns_the_values_on_a_day_and_on_many_days(self):
+        self.asset.import_snapshot(EpochDateConverter().date_to_epoch("2015-12-12"), 100)
+        ordinal = EpochDateConverter().date_to_ordinal("2015-12-12")
+        self.assertEqual(self.asset.value_on(ordinal), 100)
+        self.assertEqual(list(self.asset.values_on([ordinal - 1, ordinal])), [0, 100])
+
+    def test_it_returns_its_snapshots(self):
+        timestamp = EpochDateConverter().date_to_epoch("2015-12-12")
+        self.asset.import_snapshot(timestamp + 10, 200)
+        self.asset.import_snapshot(timestamp, 100)
+        self.assertEqual([(s.timestamp, s.value) for s in self.asset.snapshots()],
+                         [(timestamp, 100), (timestamp + 10, 200)])
+
+    def test_it_imports_many_snapshots_at_once(self):
+        timestamp = EpochDateConverter().date_to_epoch("2015-12-12")
+        self.asset.import_snapshots([(timestamp + 10, 200), (timestamp, 100)])
+        self.assertEqual(self.asset.value(timestamp + 5), 100)
+        self.assertEqual(self.asset.value(timestamp + 10), 200)
+
+    def test_it_knows_whether_it_has_a_snapshot(self):
+        timestamp = EpochDateConverter().date_to_epoch("2015-12-12")
+        self.asset.import_snapshot(timestamp, 100)
+        self.assertTrue(self.asset.has_snapshot(timestamp, 100))
+        self.assertFalse(self.asset.has_snapshot(timestamp, 200))
+        self.assertFalse(self.asset.has_snapshot(timestamp + 1, 100))
+
+    def test_it_returns_values_of_zero_at_many_query_times_if_there_are_no_snapshots(self):
+        values = self.asset.values_at([1, 2, 3])
+        self.assertEqual(list(values), [0, 0, 0])
+
     def test_the_order_in_which_snapshots_are_imported_makes_no_difference(self):
         timestamp1 = EpochDateConverter().date_to_epoch()
         timestamp2 = timestamp1 - 1
@@ -142,6 +179,15 @@ class AssetTestCase(unittest.TestCase):
         updated = self.asset.last_updated()
         self.assertEqual(updated, EpochDateConverter().epoch_to_date(epoch))
 
+    def test_it_has_an_identity(self):
+        self.assertEqual(self.asset.identity(), ("account name", "Bob Bobberson", "investment", "Cash Equivalents",
+                                                 "Rachel's Bank", "ASSET", "2001-12-12", "short"))
+
+    def test_two_accounts_with_the_same_attributes_have_the_same_identity(self):
+        self.asset_params["uuid"] = "67890"
+        same_account = Account(self.asset_params)
+        self.assertEqual(self.asset.identity(), same_account.identity())
+
     def test_an_account_is_identical_to_itself(self):
         self.assertTrue(self.asset.is_identical_to(self.asset))
 
@@ -191,5 +237,15 @@ class AssetTestCase(unittest.TestCase):
         self.assertFalse(self.asset.is_identical_to(different_account))
 
 
+    def test_it_copies_its_details_and_snapshots(self):
+        self.asset.import_snapshot(100, 10)
+        copy = self.asset.copy()
+        copy.import_snapshot(200, 20)
+        self.assertTrue(copy.is_identical_to(self.asset))
+        self.assertEqual((copy.uuid(), copy.update_frequency()), ("12345", 12))
+        self.assertEqual(self.asset.value(300), 10)
+        self.assertEqual(copy.value(300), 20)
+
+
 if __name__ == '__main__':
     unittest.main()
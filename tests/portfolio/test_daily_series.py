@@ -0,0 +1,82 @@
+import unittest
+
+from portfolio.daily_series import DailySeries
+
+
+class DailySeriesTestCase(unittest.TestCase):
+    def setUp(self):
+        self.requests = []
+        self.series = DailySeries(self.compute)
+
+    def compute(self, ordinals):
+        self.requests.append((int(ordinals[0]), int(ordinals[-1])))
+        return ordinals * 10
+
+    def test_it_computes_the_requested_days(self):
+        self.assertEqual(list(self.series.between(3, 6)), [30, 40, 50, 60])
+        self.assertEqual(self.requests, [(3, 6)])
+
+    def test_it_returns_nothing_for_an_empty_range(self):
+        self.assertEqual(list(self.series.between(6, 3)), [])
+        self.assertEqual(self.requests, [])
+
+    def test_it_serves_a_sub_range_from_the_cache(self):
+        self.series.between(3, 10)
+        self.assertEqual(list(self.series.between(5, 7)), [50, 60, 70])
+        self.assertEqual(self.requests, [(3, 10)])
+
+    def test_it_only_computes_the_new_days_when_extended_forward(self):
+        self.series.between(3, 10)
+        self.assertEqual(list(self.series.between(3, 12)), [30, 40, 50, 60, 70, 80, 90, 100, 110, 120])
+        self.assertEqual(self.requests, [(3, 10), (11, 12)])
+
+    def test_it_only_computes_the_new_days_when_extended_backward(self):
+        self.series.between(5, 10)
+        self.assertEqual(list(self.series.between(3, 6)), [30, 40, 50, 60])
+        self.assertEqual(self.requests, [(5, 10), (3, 4)])
+        self.assertEqual(len(self.series), 8)
+
+    def test_it_recomputes_only_the_days_after_an_invalidation(self):
+        self.series.between(3, 10)
+        self.series.invalidate_from(8)
+        self.assertEqual(len(self.series), 5)
+        self.series.between(3, 10)
+        self.assertEqual(self.requests, [(3, 10), (8, 10)])
+
+    def test_it_recomputes_everything_after_an_invalidation_before_the_first_day(self):
+        self.series.between(3, 10)
+        self.series.invalidate_from(1)
+        self.series.between(4, 5)
+        self.assertEqual(self.requests, [(3, 10), (4, 5)])
+
+    def test_it_computes_only_the_requested_days_if_they_are_not_cached(self):
+        self.assertEqual(list(self.series.on([3, 10, 40])), [30, 100, 400])
+        self.assertEqual(self.requests, [(3, 40)])
+        self.assertEqual(len(self.series), 0)
+
+    def test_it_serves_the_requested_days_from_the_cache(self):
+        self.series.between(3, 10)
+        self.assertEqual(list(self.series.on([3, 6, 10])), [30, 60, 100])
+        self.assertEqual(self.requests, [(3, 10)])
+
+    def test_it_computes_the_requested_days_that_reach_past_the_cache(self):
+        self.series.between(3, 10)
+        self.assertEqual(list(self.series.on([3, 11])), [30, 110])
+        self.assertEqual(self.requests, [(3, 10), (3, 11)])
+
+    def test_it_returns_a_copy_of_the_cached_values(self):
+        values = self.series.between(3, 4)
+        values[0] = -1
+        self.assertEqual(list(self.series.between(3, 4)), [30, 40])
+
+    def test_it_copies_the_cached_values_with_a_new_computation(self):
+        self.series.between(3, 10)
+        copy = self.series.copy(lambda ordinals: ordinals * 100)
+        copy.invalidate_from(8)
+        self.assertEqual(list(copy.between(6, 9)), [60, 70, 800, 900])
+        self.assertEqual(list(self.series.between(6, 9)), [60, 70, 80, 90])
+        self.assertEqual(self.requests, [(3, 10)])
+
+
+if __name__ == '__main__':
+    unittest.main()
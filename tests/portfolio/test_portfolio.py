@@ -8,6 +8,16 @@ from valid_options.account_type import AccountType
 from valid_options.asset_class import AssetClass
 
 
+class RecordingTimeline:
+    def __init__(self, timeline, requests):
+        self.timeline = timeline
+        self.requests = requests
+
+    def values_on(self, ordinals):
+        self.requests.extend(int(ordinal) for ordinal in ordinals)
+        return self.timeline.values_on(ordinals)
+
+
 class PortfolioTestCase(unittest.TestCase):
     def setUp(self):
         self.portfolio = Portfolio()
@@ -142,6 +152,25 @@ class PortfolioTestCase(unittest.TestCase):
         self.assertEqual(self.portfolio.liabilities_value("2017-03-01"), 50)
         self.assertEqual(self.portfolio.total_value("2017-03-01"), 50)
 
+    def test_it_gives_the_total_values_of_the_portfolio_at_many_times(self):
+        self.portfolio.import_data(self.asset_data_1)
+        self.portfolio.import_data(self.asset_data_2)
+        self.portfolio.import_data(self.liability_data_1)
+        query_times = [EpochDateConverter().date_to_epoch(date)
+                       for date in ["2017-05-31", "2017-06-01", "2017-06-05", "2017-07-01"]]
+        self.assertEqual(list(self.portfolio.values_at(query_times)), [0, 1000, 0, 2000])
+        self.assertEqual(list(self.portfolio.assets_values_at(query_times)), [0, 1000, 1000, 3000])
+        self.assertEqual(list(self.portfolio.liabilities_values_at(query_times)), [0, 0, 1000, 1000])
+
+    def test_it_excludes_the_mortgage_from_the_liabilities_at_many_times(self):
+        mortgage_data = {"timestamp": "2017-06-01", "name": "Mortgage", "value": 90000, "investment": "CASHX",
+                         "institution": "Bank 1", "account_type": "LIABILITY", "asset_class": "None",
+                         "owner": "Craig", "term": "none"}
+        self.portfolio.import_data(mortgage_data)
+        self.portfolio.import_data(self.liability_data_1)
+        query_times = [EpochDateConverter().date_to_epoch("2017-06-10")]
+        self.assertEqual(list(self.portfolio.liabilities_without_mortgage_values_at(query_times)), [1000])
+
     def test_it_does_not_include_liabilities_in_percentages(self):
         self.portfolio.import_data(self.asset_data_1)
         self.portfolio.import_data(self.asset_data_2)
@@ -174,6 +203,17 @@ class PortfolioTestCase(unittest.TestCase):
         self.portfolio.import_data(asset_data)
         self.assertEqual(self.portfolio.percentages(), {"A": 0.333, "B": 0.667})
 
+    def test_it_gives_the_percentages_at_a_previous_time(self):
+        self.portfolio.import_data(self.asset_data_1)
+        self.portfolio.import_data(self.asset_data_2)
+        self.assertEqual(self.portfolio.percentages("2017-06-15"), {"PG": 1.0, "VTIBX": 0})
+        self.assertEqual(self.portfolio.percentages("2017-07-01"), {"PG": 0.333, "VTIBX": 0.667})
+
+    def test_it_gives_zero_percentages_when_the_total_value_is_zero(self):
+        self.portfolio.import_data(self.asset_data_1)
+        self.portfolio.import_data(self.liability_data_1)
+        self.assertEqual(self.portfolio.percentages(), {"PG": 0})
+
     def test_it_returns_zero_for_each_asset_class_if_there_is_no_asset_data(self):
         self.assertEqual(self.portfolio.asset_classes(),
                          {"Cash Equivalents": 0, "Equities": 0, "Fixed Income": 0, "Real Estate": 0, "Commodities": 0,
@@ -243,6 +283,172 @@ class PortfolioTestCase(unittest.TestCase):
                          {"Cash Equivalents": 0, "Equities": 0.5, "Fixed Income": 0.5, "Real Estate": 0,
                           "Commodities": 0, "Annuities": 0, "Fixed Assets": 0})
 
+    def test_it_returns_the_asset_classes_at_a_previous_time(self):
+        self.portfolio.import_data(self.asset_data_1)
+        self.portfolio.import_data(self.asset_data_2)
+        self.assertEqual(self.portfolio.asset_classes("2017-06-15"),
+                         {"Cash Equivalents": 0, "Equities": 1, "Fixed Income": 0, "Real Estate": 0,
+                          "Commodities": 0, "Annuities": 0, "Fixed Assets": 0})
+
+    def test_it_groups_the_accounts_by_one_dimension(self):
+        self.portfolio.import_data(self.asset_data_1)
+        self.portfolio.import_data(self.asset_data_2)
+        self.portfolio.import_data(self.liability_data_1)
+        self.assertEqual(self.portfolio.group_by("institution"), {"Bank 1": 2000, "Bank 2": 2000})
+
+    def test_it_groups_the_accounts_by_many_dimensions(self):
+        self.portfolio.import_data(self.asset_data_1)
+        self.portfolio.import_data(self.asset_data_2)
+        self.portfolio.import_data(self.liability_data_1)
+        self.assertEqual(self.portfolio.group_by(["institution", "account_type"]),
+                         {("Bank 1", "ASSET"): 1000, ("Bank 2", "ASSET"): 2000, ("Bank 1", "LIABILITY"): 1000})
+
+    def test_it_groups_the_accounts_at_a_previous_time(self):
+        self.portfolio.import_data(self.asset_data_1)
+        self.portfolio.import_data(self.asset_data_2)
+        self.assertEqual(self.portfolio.group_by("owner", "2017-06-15"), {"Bob": 1000, "Sam": 0})
+
+    def test_it_groups_only_the_accounts_matching_a_filter(self):
+        self.portfolio.import_data(self.asset_data_1)
+        self.portfolio.import_data(self.asset_data_2)
+        self.portfolio.import_data(self.liability_data_1)
+        self.portfolio.import_data(self.liability_data_2)
+        self.assertEqual(self.portfolio.group_by("owner", filter={"account_type": "LIABILITY"}),
+                         {"Craig": 1000, "Eusavio": 1500})
+        self.assertEqual(self.portfolio.group_by("owner", filter={"account_type": "LIABILITY", "institution": "Bank 2"}),
+                         {"Eusavio": 1500})
+        self.assertEqual(self.portfolio.group_by("owner", filter={"institution": "Bank 3"}), {})
+
+    def test_it_does_not_group_the_accounts_by_an_unknown_dimension(self):
+        self.assertRaises(ValueError, self.portfolio.group_by, "color")
+        self.assertRaises(ValueError, self.portfolio.group_by, "owner", None, {"color": "red"})
+
+    def test_it_imports_many_rows_at_once(self):
+        self.portfolio.import_many([self.asset_data_1, self.asset_data_2, self.liability_data_1])
+        self.assertEqual(self.portfolio.assets_value(), 3000)
+        self.assertEqual(self.portfolio.liabilities_value(), 1000)
+        self.assertEqual([account.name() for account in self.portfolio.accounts],
+                         ["Proctor and Gamble", "Vanguard Bond Fund", "Visa Card"])
+
+    def test_it_imports_many_rows_for_the_same_account_at_once(self):
+        later_data = dict(self.asset_data_1, timestamp="2017-06-10", value=4000)
+        self.portfolio.import_many([later_data, self.asset_data_1])
+        self.assertEqual(len(self.portfolio.accounts), 1)
+        self.assertEqual(self.portfolio.assets_value("2017-06-05"), 1000)
+        self.assertEqual(self.portfolio.assets_value("2017-06-10"), 4000)
+
+    def test_it_imports_many_rows_into_an_existing_account(self):
+        self.portfolio.import_data(self.asset_data_1)
+        self.portfolio.import_many([dict(self.asset_data_1, timestamp="2017-06-10", value=4000)])
+        self.assertEqual(len(self.portfolio.accounts), 1)
+        self.assertEqual(self.portfolio.assets_value("2017-06-05"), 1000)
+        self.assertEqual(self.portfolio.assets_value("2017-06-10"), 4000)
+
+    def test_it_skips_existing_snapshots_when_importing_many_rows(self):
+        self.portfolio.import_data(self.asset_data_1)
+        inserted, timings = self.portfolio.import_many([self.asset_data_1,
+                                                        dict(self.asset_data_1, timestamp="2017-06-10", value=4000)],
+                                                       skip_existing=True)
+        self.assertEqual(inserted, 1)
+        self.assertEqual(len(self.portfolio.accounts[0].snapshots()), 2)
+
+    def test_it_keeps_its_version_when_importing_only_existing_snapshots(self):
+        self.portfolio.import_data(self.asset_data_1)
+        version = self.portfolio.version()
+        inserted, timings = self.portfolio.import_many([self.asset_data_1], skip_existing=True)
+        self.assertEqual(inserted, 0)
+        self.assertEqual(self.portfolio.version(), version)
+
+    def test_it_reports_the_time_spent_importing_many_rows(self):
+        inserted, timings = self.portfolio.import_many([self.asset_data_1])
+        self.assertEqual(sorted(timings.keys()), ["attach", "build", "group"])
+
+    def test_it_finds_the_accounts_matching_a_filter(self):
+        self.portfolio.import_data(self.asset_data_1)
+        self.portfolio.import_data(self.asset_data_2)
+        accounts = self.portfolio.accounts_matching({"name": "Vanguard Bond Fund", "owner": "Sam"})
+        self.assertEqual(accounts, [self.portfolio.accounts[1]])
+        self.assertEqual(self.portfolio.accounts_matching({"name": "Vanguard Bond Fund", "owner": "Bob"}), [])
+
+    def test_it_appends_a_snapshot_to_an_account(self):
+        self.portfolio.import_data(self.asset_data_1)
+        self.portfolio.append_snapshot(self.portfolio.accounts[0], "2017-06-03", 1500)
+        self.assertEqual(self.portfolio.assets_value("2017-06-02"), 1000)
+        self.assertEqual(self.portfolio.assets_value("2017-06-03"), 1500)
+
+    def test_it_updates_the_frequency_of_an_account(self):
+        self.portfolio.import_data(self.asset_data_1)
+        self.portfolio.update_frequency(self.portfolio.accounts[0], 45)
+        self.assertEqual(self.portfolio.accounts[0].update_frequency(), 45)
+
+    def test_it_updates_the_open_date_of_an_account(self):
+        self.portfolio.import_data(self.asset_data_1)
+        self.portfolio.update_open_date(self.portfolio.accounts[0], "2010-01-01")
+        self.portfolio.import_data(dict(self.asset_data_1, open_date="2010-01-01", timestamp="2017-06-03", value=5))
+        self.assertEqual(len(self.portfolio.accounts), 1)
+        self.assertEqual(self.portfolio.assets_value(), 5)
+
+    def test_it_merges_an_account_whose_new_open_date_matches_another_account(self):
+        self.portfolio.import_data(self.asset_data_1)
+        self.portfolio.import_data(dict(self.asset_data_1, open_date="2010-01-01", timestamp="2017-06-03", value=5))
+        self.portfolio.update_open_date(self.portfolio.accounts[0], "2010-01-01")
+        self.assertEqual(len(self.portfolio.accounts), 1)
+        self.assertEqual(self.portfolio.assets_value("2017-06-02"), 1000)
+        self.assertEqual(self.portfolio.assets_value(), 5)
+        self.assertEqual(self.portfolio.accounts_matching({"name": self.asset_data_1["name"]}),
+                         self.portfolio.accounts)
+        self.assertEqual(list(self.portfolio.net_worth_between("2017-06-01", "2017-06-03")), [1000, 1000, 5])
+
+    def test_it_copies_its_accounts(self):
+        self.portfolio.import_data(self.asset_data_1)
+        self.portfolio.import_data(self.liability_data_1)
+        copy = self.portfolio.copy()
+        copy.append_snapshot(copy.accounts[0], "2017-06-03", 1500)
+        self.assertEqual([account.uuid() for account in copy.accounts],
+                         [account.uuid() for account in self.portfolio.accounts])
+        self.assertEqual(copy.assets_value(), 1500)
+        self.assertEqual(self.portfolio.assets_value(), 1000)
+        self.assertNotEqual(copy.version(), self.portfolio.version())
+
+    def test_it_shares_the_unchanged_accounts_with_its_copy(self):
+        self.portfolio.import_data(self.asset_data_1)
+        self.portfolio.import_data(self.liability_data_1)
+        copy = self.portfolio.copy()
+        asset = copy.accounts[0]
+        copy.append_snapshot(asset, "2017-06-03", 1500)
+        copy.append_snapshot(asset, "2017-06-04", 2000)
+        self.assertIsNot(copy.accounts[0], self.portfolio.accounts[0])
+        self.assertIs(copy.accounts[1], self.portfolio.accounts[1])
+        self.assertEqual(copy.assets(), [copy.accounts[0]])
+        self.assertEqual(copy.accounts_matching({"name": "Proctor and Gamble"}), [copy.accounts[0]])
+        self.assertEqual(copy.assets_value(), 2000)
+        self.assertEqual(len(self.portfolio.accounts[0].snapshots()), 1)
+
+    def test_it_copies_a_shared_account_before_changing_its_details(self):
+        self.portfolio.import_data(self.asset_data_1)
+        copy = self.portfolio.copy()
+        copy.update_frequency(copy.accounts[0], 30)
+        copy.update_open_date(copy.accounts[0], "2017-01-01")
+        self.assertEqual(copy.accounts[0].update_frequency(), 30)
+        self.assertEqual(copy.accounts[0].open_date(), "2017-01-01")
+        self.assertEqual(self.portfolio.accounts[0].update_frequency(), 2)
+        self.assertIsNone(self.portfolio.accounts[0].open_date())
+
+    def test_it_recomputes_only_the_days_after_a_snapshot_appended_to_a_copy(self):
+        self.portfolio.import_data(self.asset_data_1)
+        self.portfolio.net_worth_between("2017-05-31", "2017-06-06")
+        copy = self.portfolio.copy()
+        copy.append_snapshot(copy.accounts[0], "2017-06-04", 1500)
+        timeline = copy.net_worth_timeline()
+        requests = []
+        copy.net_worth_timeline = lambda: RecordingTimeline(timeline, requests)
+        self.assertEqual(list(copy.net_worth_between("2017-05-31", "2017-06-06")),
+                         [0, 1000, 1000, 1000, 1500, 1500, 1500])
+        converter = EpochDateConverter()
+        self.assertEqual(requests, [converter.date_to_ordinal(date)
+                                    for date in ["2017-06-04", "2017-06-05", "2017-06-06"]])
+        self.assertEqual(list(self.portfolio.net_worth_between("2017-06-03", "2017-06-05")), [1000, 1000, 1000])
+
     def test_it_imports_an_account(self):
         account = AccountBuilder().set_name("name") \
             .set_institution("institution") \
@@ -285,6 +491,21 @@ class PortfolioTestCase(unittest.TestCase):
         self.portfolio.import_account(account)
         self.assertEqual(self.portfolio.accounts, [account])
 
+    def test_it_adds_snapshots_to_an_account_imported_directly(self):
+        account = AccountBuilder().set_name("name") \
+            .set_institution("institution") \
+            .set_owner("owner") \
+            .set_investment("investment") \
+            .set_asset_class(AssetClass.EQUITIES) \
+            .set_account_type(AccountType.ASSET) \
+            .build()
+        self.portfolio.import_account(account)
+        self.portfolio.import_data({"timestamp": "2017-01-01", "name": "name", "investment": "investment",
+                                    "value": 100, "asset_class": "Equities", "owner": "owner",
+                                    "institution": "institution", "account_type": "ASSET", "term": "none"})
+        self.assertEqual(self.portfolio.accounts, [account])
+        self.assertEqual(account.value(), 100)
+
     def test_it_returns_a_list_of_outdated_assets(self):
         account_one = AccountBuilder().set_name("name one") \
             .set_institution("institution") \
@@ -376,6 +597,87 @@ class PortfolioTestCase(unittest.TestCase):
         self.portfolio.import_account(account_two)
         self.assertEqual(self.portfolio.institutions(), ["inst"])
 
+    def test_it_has_a_different_version_than_another_portfolio(self):
+        self.assertNotEqual(self.portfolio.version(), Portfolio().version())
+
+    def test_it_changes_version_when_data_is_imported(self):
+        version = self.portfolio.version()
+        self.portfolio.import_data(self.asset_data_1)
+        self.assertNotEqual(self.portfolio.version(), version)
+
+    def test_it_changes_version_when_a_snapshot_is_appended(self):
+        self.portfolio.import_data(self.asset_data_1)
+        version = self.portfolio.version()
+        self.portfolio.append_snapshot(self.portfolio.accounts[0], "2017-06-02", 1100)
+        self.assertGreater(self.portfolio.version(), version)
+
+    def test_it_changes_version_when_account_details_are_updated(self):
+        self.portfolio.import_data(self.asset_data_1)
+        version = self.portfolio.version()
+        self.portfolio.update_frequency(self.portfolio.accounts[0], 30)
+        self.portfolio.update_open_date(self.portfolio.accounts[0], "2010-01-01")
+        self.assertGreater(self.portfolio.version(), version + 1)
+
+    def test_it_keeps_its_version_when_it_is_only_read(self):
+        self.portfolio.import_data(self.asset_data_1)
+        version = self.portfolio.version()
+        self.portfolio.total_value()
+        self.portfolio.percentages()
+        self.assertEqual(self.portfolio.version(), version)
+
+    def test_it_returns_the_net_worth_on_each_day(self):
+        self.portfolio.import_data(self.asset_data_1)
+        self.portfolio.import_data(self.liability_data_1)
+        self.assertEqual(list(self.portfolio.net_worth_between("2017-05-31", "2017-06-06")),
+                         [0, 1000, 1000, 1000, 1000, 0, 0])
+
+    def test_it_updates_the_cached_net_worth_when_a_snapshot_is_appended(self):
+        self.portfolio.import_data(self.asset_data_1)
+        self.portfolio.net_worth_between("2017-05-31", "2017-06-06")
+        self.portfolio.append_snapshot(self.portfolio.accounts[0], "2017-06-04", 1500)
+        self.assertEqual(list(self.portfolio.net_worth_between("2017-06-02", "2017-06-06")),
+                         [1000, 1000, 1500, 1500, 1500])
+
+    def test_it_returns_the_net_worth_on_selected_days(self):
+        self.portfolio.import_data(self.asset_data_1)
+        self.portfolio.import_data(self.liability_data_1)
+        converter = EpochDateConverter()
+        ordinals = [converter.date_to_ordinal(date) for date in ["2017-05-31", "2017-06-01", "2017-07-01"]]
+        values = self.portfolio.net_worth_on(ordinals)
+        daily = self.portfolio.net_worth_between("2017-05-31", "2017-07-01")
+        self.assertEqual(list(values), [daily[0], daily[1], daily[-1]])
+        self.assertEqual(list(self.portfolio.net_worth_on(ordinals)), list(values))
+
+    def test_it_returns_weighted_series_from_the_net_worth_timeline(self):
+        self.portfolio.import_data(self.asset_data_1)
+        self.portfolio.import_data(self.liability_data_1)
+        converter = EpochDateConverter()
+        ordinals = [converter.date_to_ordinal("2017-05-31"), converter.date_to_ordinal("2017-07-01")]
+        series = self.portfolio.series_on(ordinals, {"assets": lambda account: account.account_type() == "ASSET",
+                                                     "liabilities": lambda account: account.account_type() != "ASSET",
+                                                     "net": lambda account: 1 if account.account_type() == "ASSET"
+                                                     else -1})
+        self.assertEqual(list(series["assets"]), [0, self.portfolio.assets_value("2017-07-01")])
+        self.assertEqual(list(series["liabilities"]), [0, self.portfolio.liabilities_value("2017-07-01")])
+        self.assertEqual(list(series["net"]), [0, self.portfolio.total_value("2017-07-01")])
+
+    def test_it_updates_the_cached_net_worth_when_data_is_imported(self):
+        self.portfolio.import_data(self.asset_data_1)
+        self.portfolio.net_worth_between("2017-05-31", "2017-07-02")
+        self.portfolio.import_many([self.asset_data_2])
+        self.assertEqual(list(self.portfolio.net_worth_between("2017-06-30", "2017-07-02")), [1000, 3000, 3000])
+        self.portfolio.import_data(self.liability_data_2)
+        self.assertEqual(self.portfolio.net_worth_between("2017-07-01", "2017-07-31")[-1], 1500)
+
+    def test_it_updates_the_cached_net_worth_when_an_account_is_imported(self):
+        self.portfolio.import_data(self.asset_data_1)
+        self.portfolio.net_worth_between("2017-05-31", "2017-06-06")
+        account = AccountBuilder().set_name("name").set_institution("inst").set_owner("owner")\
+            .set_investment("investment").build()
+        account.import_snapshot(EpochDateConverter().date_to_epoch("2017-06-03"), 5)
+        self.portfolio.import_account(account)
+        self.assertEqual(list(self.portfolio.net_worth_between("2017-06-02", "2017-06-03")), [1000, 1005])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -15,6 +15,21 @@ class SnapshotTestCase(unittest.TestCase):
     def test_it_has_a_value(self):
         self.assertEqual(self.snapshot.value, 10235.63)
 
+    def test_it_has_the_day_ordinal_of_its_timestamp(self):
+        self.assertEqual(self.snapshot.ordinal, EpochDateConverter().epoch_to_ordinal(self.timestamp))
+
+    def test_it_can_be_given_a_day_ordinal(self):
+        snapshot = Snapshot(self.timestamp, 10, 736000)
+        self.assertEqual(snapshot.ordinal, 736000)
+
+    def test_it_does_not_have_an_attribute_dictionary(self):
+        self.assertFalse(hasattr(self.snapshot, "__dict__"))
+
+    def test_it_is_equal_to_a_snapshot_with_the_same_timestamp_and_value(self):
+        self.assertEqual(self.snapshot, Snapshot(self.timestamp, 10235.63))
+        self.assertNotEqual(self.snapshot, Snapshot(self.timestamp, 10235.64))
+        self.assertNotEqual(self.snapshot, Snapshot(self.timestamp + 1, 10235.63))
+
 
 if __name__ == '__main__':
     unittest.main()
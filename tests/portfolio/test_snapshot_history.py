@@ -1,5 +1,7 @@
 import unittest
 
+import numpy
+
 from utilities.epoch_date_converter import EpochDateConverter
 from portfolio.snapshot import Snapshot
 from portfolio.snapshot_history import SnapshotHistory
@@ -65,6 +67,95 @@ class SnapshotHistoryTestCase(unittest.TestCase):
         value = self.history.value(query_time)
         self.assertEqual(value, 10)
 
+    def test_it_keeps_the_snapshots_sorted_by_timestamp(self):
+        timestamp = self.converter.date_to_epoch()
+        snapshot1 = Snapshot(timestamp, 10)
+        snapshot2 = Snapshot(timestamp - 10, 20)
+        snapshot3 = Snapshot(timestamp - 5, 30)
+        self.history.import_snapshot(snapshot1)
+        self.history.import_snapshot(snapshot2)
+        self.history.import_snapshot(snapshot3)
+        self.assertEqual(self.history.all(), [snapshot2, snapshot3, snapshot1])
+
+    def test_the_last_imported_snapshot_wins_when_two_share_a_timestamp(self):
+        timestamp = self.converter.date_to_epoch("2015-03-04")
+        self.history.import_snapshot(Snapshot(timestamp, 10))
+        self.history.import_snapshot(Snapshot(timestamp, 20))
+        self.assertEqual(self.history.value(timestamp), 20)
+        self.assertEqual(self.history.value(timestamp - 1), 0)
+
+    def test_it_finds_the_value_in_a_long_history(self):
+        start = self.converter.date_to_epoch("2000-01-01")
+        for day in range(1000):
+            self.history.import_snapshot(Snapshot(start + day * 86400, day))
+        self.assertEqual(self.history.value(start + 500 * 86400 + 10), 500)
+        self.assertEqual(self.history.value(start + 2000 * 86400), 999)
+
+    def test_it_returns_the_values_at_many_query_times(self):
+        timestamp = self.converter.date_to_epoch("2015-03-04")
+        self.history.import_snapshot(Snapshot(timestamp + 10, 20))
+        self.history.import_snapshot(Snapshot(timestamp, 10))
+        values = self.history.values_at([timestamp - 1, timestamp, timestamp + 5, timestamp + 10, timestamp + 100])
+        self.assertEqual(list(values), [0, 10, 10, 20, 20])
+
+    def test_the_values_at_many_query_times_include_newly_imported_snapshots(self):
+        timestamp = self.converter.date_to_epoch("2015-03-04")
+        self.history.import_snapshot(Snapshot(timestamp, 10))
+        self.assertEqual(list(self.history.values_at([timestamp + 10])), [10])
+        self.history.import_snapshot(Snapshot(timestamp + 5, 30))
+        self.assertEqual(list(self.history.values_at([timestamp + 10])), [30])
+
+    def test_it_returns_the_value_on_a_day(self):
+        timestamp = self.converter.date_to_epoch("2015-03-04")
+        self.history.import_snapshot(Snapshot(timestamp + 3600, 10))
+        ordinal = self.converter.date_to_ordinal("2015-03-04")
+        self.assertEqual(self.history.value_on(ordinal - 1), 0)
+        self.assertEqual(self.history.value_on(ordinal), 10)
+        self.assertEqual(self.history.value_on(ordinal + 1), 10)
+
+    def test_it_returns_the_values_on_many_days(self):
+        self.history.import_snapshot(Snapshot(self.converter.date_to_epoch("2015-03-06"), 20))
+        self.history.import_snapshot(Snapshot(self.converter.date_to_epoch("2015-03-04"), 10))
+        ordinal = self.converter.date_to_ordinal("2015-03-03")
+        values = self.history.values_on(range(ordinal, ordinal + 5))
+        self.assertEqual(list(values), [0, 10, 10, 20, 20])
+
+    def test_it_returns_the_snapshots_as_columns(self):
+        timestamp = self.converter.date_to_epoch("2015-03-04")
+        self.history.import_snapshot(Snapshot(timestamp + 86400, 20))
+        self.history.import_snapshot(Snapshot(timestamp, 10))
+        timestamps, ordinals, values = self.history.columns()
+        ordinal = self.converter.date_to_ordinal("2015-03-04")
+        self.assertEqual(list(timestamps), [timestamp, timestamp + 86400])
+        self.assertEqual(list(ordinals), [ordinal, ordinal + 1])
+        self.assertEqual(list(values), [10, 20])
+
+    def test_it_returns_empty_columns_if_there_are_no_snapshots(self):
+        timestamps, ordinals, values = self.history.columns()
+        self.assertEqual((len(timestamps), len(ordinals), len(values)), (0, 0, 0))
+
+    def test_it_imports_many_snapshots_at_once(self):
+        timestamp = self.converter.date_to_epoch("2015-03-04")
+        self.history.import_snapshot(Snapshot(timestamp + 10, 20))
+        self.history.import_snapshots([Snapshot(timestamp + 20, 30), Snapshot(timestamp, 10), Snapshot(timestamp + 10, 25)])
+        self.assertEqual([snapshot.value for snapshot in self.history.all()], [10, 20, 25, 30])
+        self.assertEqual(self.history.value(timestamp + 15), 25)
+
+    def test_it_imports_columns_into_an_empty_history(self):
+        timestamp = self.converter.date_to_epoch("2015-03-04")
+        ordinal = self.converter.date_to_ordinal("2015-03-04")
+        self.history.import_columns(numpy.array([timestamp, timestamp + 10]), numpy.array([ordinal, ordinal]),
+                                    numpy.array([10.0, 20.0]))
+        self.assertEqual(self.history.all(), [Snapshot(timestamp, 10, ordinal), Snapshot(timestamp + 10, 20, ordinal)])
+        self.assertEqual(self.history.value(timestamp + 5), 10)
+
+    def test_it_merges_columns_into_an_existing_history(self):
+        timestamp = self.converter.date_to_epoch("2015-03-04")
+        ordinal = self.converter.date_to_ordinal("2015-03-04")
+        self.history.import_snapshot(Snapshot(timestamp + 10, 20))
+        self.history.import_columns(numpy.array([timestamp]), numpy.array([ordinal]), numpy.array([10.0]))
+        self.assertEqual([snapshot.value for snapshot in self.history.all()], [10, 20])
+
     def test_it_defaults_to_the_current_epoch_if_no_argument_is_given(self):
         timestamp = self.converter.date_to_epoch()
         self.history.import_snapshot(Snapshot(timestamp - 5, 10))
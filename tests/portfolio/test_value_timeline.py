@@ -0,0 +1,87 @@
+import unittest
+
+from portfolio.account_builder import AccountBuilder
+from portfolio.value_timeline import ValueTimeline
+from utilities.epoch_date_converter import EpochDateConverter
+
+
+class ValueTimelineTestCase(unittest.TestCase):
+    def setUp(self):
+        self.asset = AccountBuilder().set_name("name") \
+            .set_institution("institution") \
+            .set_owner("owner") \
+            .set_investment("investment") \
+            .build()
+        self.liability = AccountBuilder().set_name("name") \
+            .set_institution("institution") \
+            .set_owner("owner") \
+            .set_investment("investment") \
+            .set_liability() \
+            .build()
+        self.epoch = EpochDateConverter().date_to_epoch("2016-04-10")
+
+    def test_it_returns_values_of_zero_with_no_accounts(self):
+        timeline = ValueTimeline([])
+        self.assertEqual(list(timeline.values_at([self.epoch, self.epoch + 10])), [0, 0])
+
+    def test_it_returns_no_values_for_no_query_times(self):
+        self.asset.import_snapshot(self.epoch, 100)
+        timeline = ValueTimeline([(self.asset, 1)])
+        self.assertEqual(list(timeline.values_at([])), [])
+
+    def test_it_follows_the_snapshots_of_a_single_account(self):
+        self.asset.import_snapshot(self.epoch, 100)
+        self.asset.import_snapshot(self.epoch + 20, 50)
+        timeline = ValueTimeline([(self.asset, 1)])
+        values = timeline.values_at([self.epoch - 1, self.epoch, self.epoch + 19, self.epoch + 20, self.epoch + 99])
+        self.assertEqual(list(values), [0, 100, 100, 50, 50])
+
+    def test_it_includes_snapshots_recorded_before_the_first_query_time(self):
+        self.asset.import_snapshot(self.epoch - 500, 100)
+        self.asset.import_snapshot(self.epoch - 400, 300)
+        timeline = ValueTimeline([(self.asset, 1)])
+        self.assertEqual(list(timeline.values_at([self.epoch])), [300])
+
+    def test_it_ignores_snapshots_recorded_after_the_last_query_time(self):
+        self.asset.import_snapshot(self.epoch, 100)
+        self.asset.import_snapshot(self.epoch + 500, 300)
+        timeline = ValueTimeline([(self.asset, 1)])
+        self.assertEqual(list(timeline.values_at([self.epoch, self.epoch + 1])), [100, 100])
+
+    def test_it_weights_the_value_of_each_account(self):
+        self.asset.import_snapshot(self.epoch, 100)
+        self.liability.import_snapshot(self.epoch + 10, 30)
+        timeline = ValueTimeline([(self.asset, 1), (self.liability, -1)])
+        self.assertEqual(list(timeline.values_at([self.epoch, self.epoch + 10])), [100, 70])
+
+    def test_it_returns_the_values_on_many_days(self):
+        self.asset.import_snapshot(self.epoch, 100)
+        self.liability.import_snapshot(self.epoch + 86400 + 7200, 30)
+        timeline = ValueTimeline([(self.asset, 1), (self.liability, -1)])
+        ordinal = EpochDateConverter().date_to_ordinal("2016-04-10")
+        self.assertEqual(list(timeline.values_on([ordinal - 1, ordinal, ordinal + 1, ordinal + 2])), [0, 100, 70, 70])
+
+    def test_it_returns_the_days_on_which_the_value_changes(self):
+        self.asset.import_snapshot(self.epoch, 100)
+        self.asset.import_snapshot(self.epoch + 86400, 100)
+        self.asset.import_snapshot(self.epoch + 3 * 86400, 200)
+        self.asset.import_snapshot(self.epoch + 9 * 86400, 300)
+        timeline = ValueTimeline([(self.asset, 1)])
+        ordinal = EpochDateConverter().date_to_ordinal("2016-04-10")
+        self.assertEqual(list(timeline.change_ordinals(ordinal - 1, ordinal + 5)), [ordinal, ordinal + 3])
+
+    def test_it_returns_several_weighted_series_at_once(self):
+        self.asset.import_snapshot(self.epoch, 100)
+        self.liability.import_snapshot(self.epoch + 86400, 30)
+        timeline = ValueTimeline([(self.asset, 1), (self.liability, 1)])
+        ordinal = EpochDateConverter().date_to_ordinal("2016-04-10")
+        series = timeline.series_on([ordinal - 1, ordinal, ordinal + 1],
+                                    {"assets": [1, 0], "liabilities": [0, 1], "net": [1, -1]})
+        self.assertEqual(list(series.keys()), ["assets", "liabilities", "net"])
+        self.assertEqual(list(series["assets"]), [0, 100, 100])
+        self.assertEqual(list(series["liabilities"]), [0, 0, 30])
+        self.assertEqual(list(series["net"]), [0, 100, 70])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -8,6 +8,7 @@ from portfolio_analysis.portfolio_analyzer import PortfolioAnalyzer
 from utilities.epoch_date_converter import EpochDateConverter
 from valid_options.account_type import AccountType
 from valid_options.asset_class import AssetClass
+from valid_options.term import Term
 
 
 class PortfolioAnalyzerCase(unittest.TestCase):
@@ -106,6 +107,77 @@ class PortfolioAnalyzerCase(unittest.TestCase):
         portfolio.import_account(liability)
         self.assertEqual(PortfolioAnalyzer(portfolio).debt_to_equity(EpochDateConverter().epoch_to_date(query_time)), 1.0)
 
+    def test_it_returns_the_debt_to_equity_ratio_for_each_day(self):
+        portfolio = self.__portfolio_with_history()
+        ratios = PortfolioAnalyzer(portfolio).debt_to_equity_series("2015-03-01", "2015-03-05")
+        self.assertEqual(list(ratios), [math.inf, 0.0, 0.25, 1.0, math.inf])
+
+    def test_it_matches_the_debt_to_equity_ratio_on_each_day(self):
+        portfolio = self.__portfolio_with_history()
+        analyzer = PortfolioAnalyzer(portfolio)
+        ratios = analyzer.debt_to_equity_series("2015-03-01", "2015-03-05")
+        for day, ratio in zip(["2015-03-01", "2015-03-02", "2015-03-03", "2015-03-04", "2015-03-05"], ratios):
+            self.assertEqual(ratio, analyzer.debt_to_equity(day))
+
+    def test_it_returns_the_debt_to_assets_ratio_for_each_day(self):
+        portfolio = self.__portfolio_with_history()
+        ratios = PortfolioAnalyzer(portfolio).debt_to_assets_series("2015-03-01", "2015-03-05")
+        self.assertEqual(list(ratios), [math.inf, 0.0, 0.2, 0.5, 1.0])
+
+    def test_it_returns_the_liquidity_of_each_term_for_each_day(self):
+        portfolio = self.__portfolio_with_history()
+        liquidity = PortfolioAnalyzer(portfolio).liquidity_series("2015-03-01", "2015-03-05")
+        self.assertEqual(list(liquidity.keys()), [term.value for term in Term])
+        self.assertEqual(list(liquidity["short"]), [math.inf, math.inf, 5.0, 2.0, 1.0])
+        self.assertEqual(list(liquidity["none"]), [math.inf] * 5)
+
+    def test_it_returns_no_ratios_for_an_empty_range(self):
+        portfolio = self.__portfolio_with_history()
+        self.assertEqual(len(PortfolioAnalyzer(portfolio).debt_to_equity_series("2015-03-05", "2015-03-01")), 0)
+
+    def test_it_returns_the_value_of_the_portfolio_each_account_and_each_asset_class(self):
+        portfolio = self.__portfolio_with_history()
+        series = PortfolioAnalyzer(portfolio).value_series("2015-03-01", "2015-03-05")
+        asset, liability = portfolio.accounts
+        self.assertEqual(list(series.keys()), ["portfolio", "account:" + asset.uuid(), "account:" + liability.uuid(),
+                                               "asset_class:Cash Equivalents"])
+        self.assertEqual(list(series["portfolio"]), [0, 100, 80, 50, 0])
+        self.assertEqual(list(series["account:" + liability.uuid()]), [0, 0, 20, 50, 100])
+        self.assertEqual(list(series["asset_class:Cash Equivalents"]), [0, 100, 100, 100, 100])
+
+    def test_it_returns_the_rolling_performance_of_each_series(self):
+        portfolio = self.__portfolio_with_history()
+        performance = PortfolioAnalyzer(portfolio).rolling_performance("2015-03-01", "2015-03-05", period=1, window=2)
+        self.assertEqual(list(performance["portfolio"]["change"][1:]), [100, -20, -30, -50])
+        self.assertEqual(performance["portfolio"]["max_drawdown"],
+                         {"drawdown": -1.0, "peak": "2015-03-02", "trough": "2015-03-05"})
+        self.assertEqual(list(performance["asset_class:Cash Equivalents"]["volatility"][2:]), [0, 0, 0])
+        self.assertAlmostEqual(performance["asset_class:Cash Equivalents"]["growth"][2], 0)
+
+    def __portfolio_with_history(self):
+        converter = EpochDateConverter()
+        asset = AccountBuilder().set_name("savings") \
+            .set_institution("institution") \
+            .set_owner("owner") \
+            .set_investment("investment") \
+            .set_term(Term.SHORT) \
+            .build()
+        liability = AccountBuilder().set_name("loan") \
+            .set_institution("institution") \
+            .set_owner("owner") \
+            .set_investment("investment") \
+            .set_account_type(AccountType.LIABILITY) \
+            .set_term(Term.SHORT) \
+            .build()
+        asset.import_snapshot(converter.date_to_epoch("2015-03-02"), 100)
+        liability.import_snapshot(converter.date_to_epoch("2015-03-03"), 20)
+        liability.import_snapshot(converter.date_to_epoch("2015-03-04"), 50)
+        liability.import_snapshot(converter.date_to_epoch("2015-03-05"), 100)
+        portfolio = Portfolio()
+        portfolio.import_account(asset)
+        portfolio.import_account(liability)
+        return portfolio
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,74 @@
+import math
+import unittest
+
+import numpy
+
+from portfolio_analysis.rolling_statistics import RollingStatistics
+from utilities.epoch_date_converter import EpochDateConverter
+
+
+class RollingStatisticsTestCase(unittest.TestCase):
+    def setUp(self):
+        self.first_ordinal = EpochDateConverter().date_to_ordinal("2016-01-01")
+
+    def test_it_returns_the_change_over_a_period(self):
+        statistics = RollingStatistics([100, 110, 90, 120], self.first_ordinal)
+        changes = statistics.change(2)
+        self.assertTrue(math.isnan(changes[0]) and math.isnan(changes[1]))
+        self.assertEqual(list(changes[2:]), [-10, 10])
+
+    def test_it_returns_no_changes_for_a_period_longer_than_the_series(self):
+        statistics = RollingStatistics([100, 110], self.first_ordinal)
+        self.assertTrue(numpy.isnan(statistics.change(5)).all())
+
+    def test_it_annualizes_the_growth_over_a_period(self):
+        statistics = RollingStatistics([100, 100, 121], self.first_ordinal)
+        growth = statistics.growth(2)
+        self.assertAlmostEqual(growth[2], 1.21 ** (365 / 2) - 1)
+
+    def test_it_has_no_growth_from_or_to_a_non_positive_value(self):
+        statistics = RollingStatistics([0, 100, -50, 100], self.first_ordinal)
+        self.assertTrue(numpy.isnan(statistics.growth(1)).all())
+
+    def test_it_has_no_volatility_for_a_steady_series(self):
+        statistics = RollingStatistics([100] * 10, self.first_ordinal)
+        volatility = statistics.volatility(3)
+        self.assertTrue(numpy.isnan(volatility[:3]).all())
+        self.assertEqual(list(volatility[3:]), [0] * 7)
+
+    def test_it_matches_the_standard_deviation_of_the_daily_returns_in_each_window(self):
+        values = numpy.array([100, 102, 99, 105, 104, 110, 108, 111])
+        volatility = RollingStatistics(values, self.first_ordinal).volatility(4)
+        returns = numpy.diff(values) / values[:-1]
+        for day in range(4, len(values)):
+            self.assertAlmostEqual(volatility[day], numpy.std(returns[day - 4:day]) * math.sqrt(365))
+
+    def test_it_matches_the_variance_of_each_window_after_a_large_jump(self):
+        values = numpy.concatenate(([0.01], 50000 * numpy.cumprod(1 + 0.001 * numpy.cos(numpy.arange(60)))))
+        volatility = RollingStatistics(values, self.first_ordinal).volatility(30)
+        returns = numpy.diff(values) / values[:-1]
+        for day in range(30, len(values)):
+            self.assertAlmostEqual(volatility[day], math.sqrt(numpy.var(returns[day - 30:day]) * 365))
+        self.assertGreater(volatility[-1], 0.01)
+
+    def test_it_rejects_a_period_or_window_shorter_than_a_day(self):
+        statistics = RollingStatistics([100, 110, 90], self.first_ordinal)
+        self.assertRaises(ValueError, statistics.change, 0)
+        self.assertRaises(ValueError, statistics.growth, -1)
+        self.assertRaises(ValueError, statistics.volatility, 0)
+
+    def test_it_returns_the_maximum_drawdown_with_its_peak_and_trough(self):
+        statistics = RollingStatistics([100, 120, 90, 130, 65, 80], self.first_ordinal)
+        self.assertEqual(statistics.max_drawdown(), {"drawdown": -0.5, "peak": "2016-01-04", "trough": "2016-01-05"})
+
+    def test_it_has_no_drawdown_for_a_rising_series(self):
+        statistics = RollingStatistics([100, 120, 130], self.first_ordinal)
+        self.assertEqual(statistics.max_drawdown(), {"drawdown": 0.0, "peak": "2016-01-01", "trough": "2016-01-01"})
+
+    def test_it_has_no_drawdown_for_an_empty_series(self):
+        statistics = RollingStatistics([], self.first_ordinal)
+        self.assertEqual(statistics.max_drawdown(), {"drawdown": 0.0, "peak": None, "trough": None})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from portfolio_creator.data_source import DataSource
+from portfolio_creator.portfolio_creator import PortfolioCreator
+
+
+def snapshot(timestamp, value):
+    return {"timestamp": timestamp, "institution": "John's Union", "account": "Checking", "owner": "Robert",
+            "investment": "CASHX", "asset": True, "value": value, "asset_class": "Cash Equivalents",
+            "update_frequency": 12, "open_date": None}
+
+
+class LedgerHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        since = parse_qs(urlparse(self.path).query).get("since", [None])[0]
+        self.server.requests.append(since)
+        snapshots = [s for s in self.server.snapshots if since is None or s["timestamp"] >= since]
+        body = json.dumps({"snapshots": snapshots}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class DataSourceTestCase(unittest.TestCase):
+    def setUp(self):
+        self.server = HTTPServer(("127.0.0.1", 0), LedgerHandler)
+        self.server.snapshots = [snapshot("2017-01-02", 10000), snapshot("2017-01-05", 20000)]
+        self.server.requests = []
+        threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True).start()
+        self.data_source = DataSource("http://127.0.0.1:" + str(self.server.server_port))
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_it_gets_every_snapshot(self):
+        self.assertEqual(len(json.loads(self.data_source.get())["snapshots"]), 2)
+        self.assertEqual(self.server.requests, [None])
+
+    def test_it_gets_the_snapshots_since_a_cursor(self):
+        snapshots = json.loads(self.data_source.get_since("2017-01-03"))["snapshots"]
+        self.assertEqual([s["timestamp"] for s in snapshots], ["2017-01-05"])
+        self.assertEqual(self.server.requests, ["2017-01-03"])
+
+    def test_it_gets_every_snapshot_without_a_cursor(self):
+        self.assertEqual(len(json.loads(self.data_source.get_since(None))["snapshots"]), 2)
+
+    def test_it_refreshes_a_portfolio_with_only_the_new_snapshots(self):
+        creator = PortfolioCreator()
+        portfolio = creator.create(self.data_source)
+        self.assertEqual(creator.cursor, "2017-01-05")
+        self.server.snapshots.append(snapshot("2017-01-09", 30000))
+        self.assertEqual(creator.update(portfolio, self.data_source.get_since(creator.cursor)), 1)
+        self.assertEqual(self.server.requests, [None, "2017-01-05"])
+        self.assertEqual(creator.cursor, "2017-01-09")
+        self.assertEqual(len(portfolio.accounts), 1)
+        self.assertEqual(len(portfolio.accounts[0].snapshots()), 3)
+        self.assertEqual(portfolio.total_value(), 300)
+
+
+if __name__ == '__main__':
+    unittest.main()
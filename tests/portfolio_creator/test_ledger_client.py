@@ -0,0 +1,143 @@
+import gzip
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+
+from portfolio_creator.data_source import DataSource
+from portfolio_creator.ledger_client import LedgerClient
+from portfolio_creator.portfolio_creator import PortfolioCreator
+
+PAYLOAD = json.dumps({"snapshots": [{"timestamp": "2017-01-02", "institution": "John's Union", "account": "Checking",
+                                     "owner": "Robert", "investment": "CASHX", "asset": True, "value": 10000,
+                                     "asset_class": "Cash Equivalents", "update_frequency": 12,
+                                     "open_date": None}]}).encode("utf-8")
+
+
+class LedgerHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.server.connections.add(self.client_address)
+        if self.headers.get("If-None-Match") == self.server.etag:
+            self.send_response(304)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = PAYLOAD
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("ETag", self.server.etag)
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        if self.headers.get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+        self.server.posts.append((self.path, json.loads(body.decode("utf-8"))))
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class LedgerServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class LedgerClientTestCase(unittest.TestCase):
+    def setUp(self):
+        self.server = LedgerServer(("127.0.0.1", 0), LedgerHandler)
+        self.server.etag = '"version-1"'
+        self.server.connections = set()
+        self.server.posts = []
+        threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True).start()
+        self.url = "http://127.0.0.1:" + str(self.server.server_port)
+        self.client = LedgerClient(self.url)
+
+    def tearDown(self):
+        self.client.session.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_it_gets_and_decompresses_the_payload(self):
+        self.assertEqual(self.client.get(), PAYLOAD.decode("utf-8"))
+
+    def test_it_returns_nothing_when_the_payload_has_not_been_modified(self):
+        self.client.get()
+        self.assertIsNone(self.client.get())
+
+    def test_it_gets_the_payload_again_when_the_version_changes(self):
+        self.client.get()
+        self.server.etag = '"version-2"'
+        self.assertEqual(self.client.get(), PAYLOAD.decode("utf-8"))
+
+    def test_it_reports_the_version_of_the_last_payload(self):
+        self.assertIsNone(self.client.validators())
+        self.client.get()
+        self.assertEqual(self.client.validators(), ('"version-1"', None))
+
+    def test_it_assumes_a_previously_seen_version(self):
+        client = LedgerClient(self.url)
+        client.assume_validators(['"version-1"', None])
+        self.assertIsNone(client.get())
+        client.session.close()
+
+    def test_it_forgets_the_version_when_none_is_assumed(self):
+        self.client.get()
+        self.client.assume_validators(None)
+        self.assertIsNone(self.client.validators())
+        self.assertEqual(self.client.get(), PAYLOAD.decode("utf-8"))
+
+    def test_it_streams_and_decompresses_the_payload(self):
+        self.assertEqual(b"".join(self.client.stream()), PAYLOAD)
+
+    def test_it_streams_nothing_when_the_payload_has_not_been_modified(self):
+        b"".join(self.client.stream())
+        self.assertIsNone(self.client.stream())
+
+    def test_it_creates_a_portfolio_from_a_stream(self):
+        portfolio = PortfolioCreator().create_streaming(DataSource(client=self.client))
+        self.assertEqual(portfolio.total_value(), 100)
+
+    def test_it_reuses_one_connection(self):
+        self.client.get()
+        self.client.get()
+        self.client.get()
+        self.assertEqual(len(self.server.connections), 1)
+
+    def test_it_posts_json(self):
+        response = self.client.post("/append_snapshot", json.dumps({"value": 1}))
+        self.assertTrue(response.ok)
+        self.assertEqual(self.server.posts, [("/append_snapshot", {"value": 1})])
+
+    def test_it_posts_compressed_json(self):
+        client = LedgerClient(self.url, compress_requests=True)
+        client.post("/update_frequency", json.dumps({"frequency": 3}))
+        client.session.close()
+        self.assertEqual(self.server.posts, [("/update_frequency", {"frequency": 3})])
+
+    def test_it_keeps_the_portfolio_when_the_payload_has_not_been_modified(self):
+        data_source = DataSource(client=self.client)
+        portfolio = PortfolioCreator().create(data_source)
+        self.assertIs(PortfolioCreator().create_if_modified(data_source, portfolio), portfolio)
+        self.server.etag = '"version-2"'
+        self.assertIsNot(PortfolioCreator().create_if_modified(data_source, portfolio), portfolio)
+
+    def test_it_creates_a_portfolio_even_if_the_payload_has_not_been_modified(self):
+        data_source = DataSource(client=self.client)
+        self.client.get()
+        self.assertEqual(PortfolioCreator().create(data_source).total_value(), 100)
+        self.assertEqual(PortfolioCreator().create_streaming(data_source).total_value(), 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import os
+import tempfile
+import unittest
+
+from portfolio.portfolio import Portfolio
+from portfolio_creator.portfolio_cache import PortfolioCache
+from utilities.constants import Constants
+from utilities.epoch_date_converter import EpochDateConverter
+
+
+class PortfolioCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = PortfolioCache(os.path.join(self.directory.name, "portfolio.cache"))
+        self.converter = EpochDateConverter()
+        self.portfolio = Portfolio()
+        self.portfolio.import_data({"timestamp": "2017-01-02", "institution": "John's Union", "name": "Checking",
+                                    "owner": "Robert", "investment": "CASHX", "account_type": "ASSET",
+                                    "value": 980.66, "asset_class": "Cash Equivalents", "update_frequency": 12,
+                                    "open_date": None, "term": "none"})
+        self.portfolio.import_data({"timestamp": "2017-03-05", "institution": "John's Union", "name": "Checking",
+                                    "owner": "Robert", "investment": "CASHX", "account_type": "ASSET",
+                                    "value": 1200, "asset_class": "Cash Equivalents", "update_frequency": 12,
+                                    "open_date": None, "term": "none"})
+        self.portfolio.import_data({"timestamp": "2017-10-25", "institution": "Bob's Bank", "name": "Credit Card",
+                                    "owner": "John", "investment": "CASHX", "account_type": "LIABILITY",
+                                    "value": 1000, "asset_class": "None", "update_frequency": 22,
+                                    "open_date": "2000-11-12", "term": "medium"})
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_it_returns_none_if_nothing_has_been_cached(self):
+        self.assertIsNone(self.cache.load())
+        self.assertIsNone(self.cache.version())
+        self.assertIsNone(self.cache.cursor())
+
+    def test_it_returns_none_if_the_file_is_not_a_portfolio_cache(self):
+        with open(self.cache.path, "wb") as cache_file:
+            cache_file.write(b"not a portfolio cache")
+        self.assertIsNone(self.cache.load())
+
+    def test_it_restores_the_account_metadata(self):
+        self.cache.save(self.portfolio)
+        portfolio = self.cache.load()
+        self.assertEqual([account.identity() for account in portfolio.accounts],
+                         [account.identity() for account in self.portfolio.accounts])
+        self.assertEqual([account.uuid() for account in portfolio.accounts],
+                         [account.uuid() for account in self.portfolio.accounts])
+        self.assertEqual([account.update_frequency() for account in portfolio.accounts], [12, 22])
+
+    def test_it_restores_the_snapshots(self):
+        self.cache.save(self.portfolio)
+        portfolio = self.cache.load()
+        self.assertEqual(portfolio.accounts[0].snapshots(), self.portfolio.accounts[0].snapshots())
+        self.assertEqual(portfolio.accounts[1].snapshots(), self.portfolio.accounts[1].snapshots())
+        self.assertAlmostEqual(portfolio.total_value(), 200)
+        self.assertAlmostEqual(portfolio.total_value("2017-02-01"), 980.66)
+
+    def test_it_restores_an_empty_portfolio(self):
+        self.cache.save(Portfolio())
+        self.assertEqual(self.cache.load().accounts, [])
+
+    def test_it_remembers_the_version_and_cursor(self):
+        self.cache.save(self.portfolio, ["\"abc\"", None], "2017-10-25")
+        self.assertEqual(self.cache.version(), ["\"abc\"", None])
+        self.assertEqual(self.cache.cursor(), "2017-10-25")
+
+    def test_it_replaces_an_older_cache(self):
+        self.cache.save(Portfolio(), "old")
+        self.cache.save(self.portfolio, "new")
+        self.assertEqual(len(self.cache.load().accounts), 2)
+        self.assertEqual(self.cache.version(), "new")
+        self.assertFalse(os.path.exists(self.cache.path + ".tmp"))
+
+    def test_it_returns_none_if_the_cache_is_truncated(self):
+        self.cache.save(self.portfolio, "v1", "2017-10-25")
+        with open(self.cache.path, "rb") as cache_file:
+            data = cache_file.read()
+        for length in [len(PortfolioCache.MAGIC) + 4, len(PortfolioCache.MAGIC) + 20, len(data) - 4]:
+            with open(self.cache.path, "wb") as cache_file:
+                cache_file.write(data[:length])
+            self.assertIsNone(self.cache.load())
+            self.assertIsNone(self.cache.version())
+            self.assertIsNone(self.cache.cursor())
+
+    def test_it_is_stored_in_the_repository_root_by_default(self):
+        self.assertEqual(PortfolioCache().path, os.path.join(Constants.ROOT_DIRECTORY, "portfolio.cache"))
+        self.assertTrue(os.path.isfile(os.path.join(Constants.ROOT_DIRECTORY, "utilities", "constants.py")))
+
+
+if __name__ == '__main__':
+    unittest.main()
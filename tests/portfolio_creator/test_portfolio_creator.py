@@ -1,10 +1,24 @@
+import os
+import tempfile
 import unittest
 import json
 
+from portfolio_creator.portfolio_cache import PortfolioCache
 from portfolio_creator.portfolio_creator import PortfolioCreator
+from utilities.epoch_date_converter import EpochDateConverter
 
 
 class MockDataSource:
+    def assume_version(self, version):
+        pass
+
+    def stream(self):
+        data = self.get()
+        if data is None:
+            return None
+        data = data.encode("utf-8")
+        return [data[i:i + 7] for i in range(0, len(data), 7)]
+
     def get(self):
         return json.dumps({"snapshots": [{"timestamp": "2017-01-02",
                                           "institution": "John's Union",
@@ -40,6 +54,28 @@ class MockDataSource:
                                          ]})
 
 
+class VersionedMockDataSource(MockDataSource):
+    def __init__(self, current_version):
+        self.current_version = current_version
+        self.assumed_version = None
+
+    def get(self):
+        if self.assumed_version == self.current_version:
+            return None
+        return super().get()
+
+    def version(self):
+        return self.current_version
+
+    def assume_version(self, version):
+        self.assumed_version = version
+
+
+class UnreachableMockDataSource(VersionedMockDataSource):
+    def stream(self):
+        raise ConnectionError("ledger is down")
+
+
 class PortfolioCreatorTestCase(unittest.TestCase):
     def setUp(self):
         self.portfolio = PortfolioCreator().create(MockDataSource())
@@ -87,6 +123,147 @@ class PortfolioCreatorTestCase(unittest.TestCase):
         third_account = accounts[2]
         self.assertEqual(third_account.term(), "none")
 
+    def test_it_reports_the_time_spent_creating_the_portfolio(self):
+        creator = PortfolioCreator()
+        creator.create(MockDataSource())
+        self.assertEqual(sorted(creator.timings.keys()), ["attach", "build", "fetch", "group", "parse"])
+
+    def test_it_appends_a_snapshot_to_an_existing_account(self):
+        PortfolioCreator().append_snapshot(self.portfolio, {"account": "Checking", "institution": "John's Union",
+                                                            "owner": "Robert", "investment": "CASHX", "asset": True,
+                                                            "value": 12345, "timestamp": "2017-02-01"})
+        self.assertEqual(len(self.portfolio.accounts), 3)
+        self.assertEqual(self.portfolio.accounts[0].value(), 123.45)
+        self.assertEqual(self.portfolio.accounts[0].value(EpochDateConverter().date_to_epoch("2017-01-31")), 980.66)
+
+    def test_it_appends_a_snapshot_for_a_new_account(self):
+        PortfolioCreator().append_snapshot(self.portfolio, {"account": "Savings", "institution": "John's Union",
+                                                            "owner": "Robert", "investment": "CASHX", "asset": True,
+                                                            "value": 500, "timestamp": "2017-02-01"})
+        self.assertEqual(len(self.portfolio.accounts), 4)
+        self.assertEqual(self.portfolio.accounts[3].name(), "Savings")
+        self.assertEqual(self.portfolio.accounts[3].value(), 5)
+
+    def test_it_appends_a_snapshot_to_only_one_matching_account(self):
+        self.portfolio.import_data({"timestamp": "2017-01-02", "institution": "John's Union", "name": "Checking",
+                                    "owner": "Robert", "investment": "CASHX", "account_type": "ASSET",
+                                    "value": 10, "asset_class": "Cash Equivalents", "open_date": "2010-01-01",
+                                    "term": "none"})
+        PortfolioCreator().append_snapshot(self.portfolio, {"account": "Checking", "institution": "John's Union",
+                                                            "owner": "Robert", "investment": "CASHX", "asset": True,
+                                                            "value": 12345, "timestamp": "2017-02-01"})
+        self.assertEqual(self.portfolio.accounts[0].value(), 123.45)
+        self.assertEqual(self.portfolio.accounts[3].value(), 10)
+
+    def test_it_rejects_a_snapshot_with_an_invalid_timestamp(self):
+        with self.assertRaises(ValueError):
+            PortfolioCreator().validate_snapshot({"account": "Checking", "institution": "John's Union",
+                                                  "owner": "Robert", "investment": "CASHX", "asset": True,
+                                                  "value": 12345, "timestamp": ""})
+
+    def test_it_updates_the_frequency_of_an_existing_account(self):
+        PortfolioCreator().update_frequency(self.portfolio, {"account": "Credit Card", "institution": "Bob's Bank",
+                                                             "owner": "John", "investment": "CASHX", "asset": False,
+                                                             "frequency": 30})
+        self.assertEqual(self.portfolio.accounts[1].update_frequency(), 30)
+        self.assertEqual(self.portfolio.accounts[2].update_frequency(), 195)
+
+    def test_it_updates_the_open_date_of_an_existing_account(self):
+        PortfolioCreator().update_open_date(self.portfolio, {"account": "Credit Card", "institution": "Bob's Bank",
+                                                             "owner": "John", "investment": "CASHX", "asset": False,
+                                                             "open_date": "2001-01-01"})
+        self.assertEqual(self.portfolio.accounts[1].open_date(), "2001-01-01")
+        self.portfolio.import_data({"timestamp": "2017-11-01", "institution": "Bob's Bank", "name": "Credit Card",
+                                    "owner": "John", "investment": "CASHX", "account_type": "LIABILITY",
+                                    "value": 50, "asset_class": "None", "open_date": "2001-01-01", "term": "medium"})
+        self.assertEqual(len(self.portfolio.accounts), 3)
+        self.assertEqual(self.portfolio.accounts[1].value(), 50)
+
+    def test_it_remembers_the_newest_snapshot_timestamp(self):
+        creator = PortfolioCreator()
+        creator.create(MockDataSource())
+        self.assertEqual(creator.cursor, "2017-10-26")
+
+    def test_it_updates_a_portfolio_with_a_delta(self):
+        creator = PortfolioCreator()
+        portfolio = creator.create(MockDataSource())
+        delta = json.dumps({"snapshots": [{"timestamp": "2017-10-26", "institution": "Sam's Bank",
+                                           "account": "Credit Card", "owner": "John", "investment": "CASHX",
+                                           "asset": False, "value": 100000, "update_frequency": 195,
+                                           "open_date": "2017-1-1", "term": None},
+                                          {"timestamp": "2017-11-01", "institution": "John's Union",
+                                           "account": "Checking", "owner": "Robert", "investment": "CASHX",
+                                           "asset": True, "value": 5000, "asset_class": "Cash Equivalents",
+                                           "update_frequency": 12, "open_date": None}]})
+        self.assertEqual(creator.update(portfolio, delta), 1)
+        self.assertEqual(creator.cursor, "2017-11-01")
+        self.assertEqual(len(portfolio.accounts), 3)
+        self.assertEqual(len(portfolio.accounts[2].snapshots()), 1)
+        self.assertAlmostEqual(portfolio.total_value(), -1950)
+
+    def test_it_creates_the_same_portfolio_from_a_stream(self):
+        creator = PortfolioCreator()
+        portfolio = creator.create_streaming(MockDataSource(), batch_size=2)
+        self.assertEqual([account.identity() for account in portfolio.accounts],
+                         [account.identity() for account in self.portfolio.accounts])
+        self.assertAlmostEqual(portfolio.total_value(), -1019.34)
+        self.assertEqual(creator.cursor, "2017-10-26")
+        self.assertEqual(sorted(creator.timings.keys()), ["attach", "build", "group"])
+
+    def test_it_saves_a_freshly_built_portfolio_to_the_cache(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = PortfolioCache(os.path.join(directory, "portfolio.cache"))
+            portfolio = PortfolioCreator().create_cached(VersionedMockDataSource("v1"), cache)
+            self.assertAlmostEqual(portfolio.total_value(), -1019.34)
+            self.assertEqual(cache.version(), "v1")
+            self.assertEqual(cache.cursor(), "2017-10-26")
+
+    def test_it_loads_the_cached_portfolio_if_the_backend_has_not_changed(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = PortfolioCache(os.path.join(directory, "portfolio.cache"))
+            PortfolioCreator().create_cached(VersionedMockDataSource("v1"), cache)
+            creator = PortfolioCreator()
+            portfolio = creator.create_cached(VersionedMockDataSource("v1"), cache)
+            self.assertEqual([account.identity() for account in portfolio.accounts],
+                             [account.identity() for account in self.portfolio.accounts])
+            self.assertAlmostEqual(portfolio.total_value(), -1019.34)
+            self.assertEqual(creator.cursor, "2017-10-26")
+            self.assertNotIn("attach", creator.timings)
+
+    def test_it_rebuilds_the_cached_portfolio_if_the_backend_has_a_newer_version(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = PortfolioCache(os.path.join(directory, "portfolio.cache"))
+            PortfolioCreator().create_cached(VersionedMockDataSource("v1"), cache)
+            creator = PortfolioCreator()
+            creator.create_cached(VersionedMockDataSource("v2"), cache)
+            self.assertIn("attach", creator.timings)
+            self.assertEqual(cache.version(), "v2")
+
+    def test_it_loads_the_cached_portfolio_if_the_backend_is_unreachable(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = PortfolioCache(os.path.join(directory, "portfolio.cache"))
+            PortfolioCreator().create_cached(VersionedMockDataSource("v1"), cache)
+            portfolio = PortfolioCreator().create_cached(UnreachableMockDataSource("v2"), cache)
+            self.assertAlmostEqual(portfolio.total_value(), -1019.34)
+            self.assertEqual(cache.version(), "v1")
+
+    def test_it_rebuilds_the_portfolio_if_the_cache_is_truncated(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = PortfolioCache(os.path.join(directory, "portfolio.cache"))
+            PortfolioCreator().create_cached(VersionedMockDataSource("v1"), cache)
+            with open(cache.path, "r+b") as cache_file:
+                cache_file.truncate(os.path.getsize(cache.path) - 8)
+            portfolio = PortfolioCreator().create_cached(VersionedMockDataSource("v1"), cache)
+            self.assertAlmostEqual(portfolio.total_value(), -1019.34)
+            self.assertEqual(cache.version(), "v1")
+            self.assertIsNotNone(cache.load())
+
+    def test_it_raises_if_the_backend_is_unreachable_and_nothing_is_cached(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = PortfolioCache(os.path.join(directory, "portfolio.cache"))
+            with self.assertRaises(ConnectionError):
+                PortfolioCreator().create_cached(UnreachableMockDataSource("v1"), cache)
+
 
 if __name__ == '__main__':
     unittest.main()
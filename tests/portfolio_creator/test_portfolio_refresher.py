@@ -0,0 +1,244 @@
+import json
+import threading
+import unittest
+
+from portfolio.portfolio import Portfolio
+from portfolio_creator.portfolio_creator import PortfolioCreator
+from portfolio_creator.portfolio_refresher import PortfolioRefresher
+
+
+def snapshot(timestamp, value):
+    return {"timestamp": timestamp, "institution": "John's Union", "account": "Checking", "owner": "Robert",
+            "investment": "CASHX", "asset": True, "value": value, "asset_class": "Cash Equivalents",
+            "update_frequency": 12, "open_date": None}
+
+
+class MockDataSource:
+    def __init__(self):
+        self.snapshots = [snapshot("2017-01-02", 10000)]
+        self.modified = True
+        self.served = None
+        self.fetched = threading.Event()
+        self.error = None
+        self.since_error = None
+        self.requests = []
+        self.before_returning = None
+
+    def get(self):
+        self.fetched.set()
+        if self.error is not None:
+            raise self.error
+        data = json.dumps({"snapshots": self.snapshots}) if self.modified else None
+        if self.modified:
+            self.served = len(self.snapshots)
+        self.modified = False
+        if self.before_returning is not None:
+            self.before_returning()
+        return data
+
+    def get_since(self, cursor):
+        self.requests.append(cursor)
+        if self.since_error is not None:
+            raise self.since_error
+        data = self.get()
+        if data is None or cursor is None:
+            return data
+        return json.dumps({"snapshots": [s for s in self.snapshots if s["timestamp"] >= cursor]})
+
+    def stream(self):
+        data = self.get()
+        return None if data is None else [data.encode("utf-8")]
+
+    def version(self):
+        return self.served
+
+    def assume_version(self, version):
+        if version != len(self.snapshots):
+            self.modified = True
+
+
+class MockCache:
+    def __init__(self):
+        self.saved = []
+
+    def save(self, portfolio, version=None, cursor=None):
+        self.saved.append((portfolio, version, cursor))
+
+
+class PortfolioRefresherTestCase(unittest.TestCase):
+    def setUp(self):
+        self.data_source = MockDataSource()
+        self.portfolio = PortfolioCreator().create(self.data_source)
+        self.refresher = PortfolioRefresher(self.data_source, self.portfolio, interval=60)
+
+    def test_it_publishes_the_initial_portfolio(self):
+        self.assertIs(self.refresher.portfolio(), self.portfolio)
+
+    def test_it_keeps_the_portfolio_if_the_data_has_not_changed(self):
+        self.assertFalse(self.refresher.refresh())
+        self.assertIs(self.refresher.portfolio(), self.portfolio)
+
+    def test_it_swaps_in_a_new_portfolio_if_the_data_has_changed(self):
+        self.data_source.snapshots.append(snapshot("2017-01-05", 20000))
+        self.data_source.modified = True
+        self.assertTrue(self.refresher.refresh())
+        self.assertIsNot(self.refresher.portfolio(), self.portfolio)
+        self.assertEqual(self.refresher.portfolio().total_value(), 200)
+        self.assertEqual(self.portfolio.total_value(), 100)
+
+    def test_it_asks_only_for_the_snapshots_since_the_last_load(self):
+        refresher = PortfolioRefresher(self.data_source)
+        refresher.portfolio()
+        self.data_source.snapshots.append(snapshot("2017-01-05", 20000))
+        self.data_source.modified = True
+        self.assertTrue(refresher.refresh())
+        self.assertEqual(self.data_source.requests, ["2017-01-02"])
+        self.assertEqual(len(refresher.portfolio().accounts[0].snapshots()), 2)
+        self.assertEqual(refresher.portfolio().total_value(), 200)
+
+    def test_it_rebuilds_the_portfolio_if_the_ledger_cannot_send_a_delta(self):
+        self.data_source.since_error = ValueError("since is not supported")
+        self.data_source.snapshots.append(snapshot("2017-01-05", 20000))
+        self.data_source.modified = True
+        self.assertTrue(self.refresher.refresh())
+        self.assertEqual(self.refresher.portfolio().total_value(), 200)
+        self.assertIsNone(self.refresher.status()["last_error"])
+
+    def test_it_saves_a_new_portfolio_to_the_cache(self):
+        cache = MockCache()
+        refresher = PortfolioRefresher(self.data_source, self.portfolio, cache)
+        self.data_source.snapshots.append(snapshot("2017-01-05", 20000))
+        self.data_source.modified = True
+        refresher.refresh()
+        self.assertEqual(cache.saved, [(refresher.portfolio(), 2, "2017-01-05")])
+
+    def test_it_keeps_the_portfolio_if_a_delta_has_only_existing_snapshots(self):
+        cache = MockCache()
+        refresher = PortfolioRefresher(self.data_source, self.portfolio, cache)
+        version = self.portfolio.version()
+        self.data_source.modified = True
+        self.assertFalse(refresher.refresh())
+        self.data_source.modified = True
+        self.assertFalse(refresher.refresh())
+        self.assertIs(refresher.portfolio(), self.portfolio)
+        self.assertEqual(refresher.portfolio().version(), version)
+        self.assertEqual(refresher.status()["generation"], 0)
+        self.assertEqual(cache.saved, [])
+
+    def test_it_applies_changes_to_the_published_portfolio(self):
+        self.refresher.apply(lambda portfolio: portfolio.append_snapshot(portfolio.accounts[0], "2017-01-03", 300))
+        self.assertEqual(self.refresher.portfolio().total_value(), 300)
+        self.assertEqual(self.refresher.status()["generation"], 1)
+
+    def test_it_applies_changes_to_a_copy_of_the_published_portfolio(self):
+        self.refresher.apply(lambda portfolio: portfolio.append_snapshot(portfolio.accounts[0], "2017-01-03", 300))
+        self.assertIsNot(self.refresher.portfolio(), self.portfolio)
+        self.assertEqual(self.portfolio.total_value(), 100)
+
+    def test_it_copies_only_the_changed_account_when_applying_a_change(self):
+        self.data_source.snapshots.append(dict(snapshot("2017-01-02", 500), account="Savings"))
+        portfolio = PortfolioCreator().create(self.data_source)
+        refresher = PortfolioRefresher(self.data_source, portfolio, interval=60)
+        refresher.apply(lambda portfolio: portfolio.append_snapshot(portfolio.accounts[0], "2017-01-03", 300))
+        self.assertIsNot(refresher.portfolio().accounts[0], portfolio.accounts[0])
+        self.assertIs(refresher.portfolio().accounts[1], portfolio.accounts[1])
+        self.assertEqual(portfolio.total_value(), 105)
+        self.assertEqual(refresher.portfolio().total_value(), 305)
+
+    def test_it_keeps_a_change_applied_while_a_delta_is_fetched(self):
+        change = lambda portfolio: portfolio.append_snapshot(portfolio.accounts[0], "2017-01-03", 300)
+        self.data_source.snapshots.append(snapshot("2017-01-05", 500))
+        self.data_source.modified = True
+        self.data_source.before_returning = lambda: self.refresher.apply(change)
+        self.assertTrue(self.refresher.refresh())
+        self.assertEqual(self.refresher.portfolio().total_value("2017-01-04"), 300)
+        self.assertEqual(self.refresher.portfolio().total_value(), 5)
+
+    def test_it_fetches_again_after_discarding_a_rebuild_that_raced_a_change(self):
+        change = lambda portfolio: portfolio.append_snapshot(portfolio.accounts[0], "2017-01-03", 300)
+        self.data_source.since_error = ValueError("since is not supported")
+        self.data_source.snapshots.append(snapshot("2017-01-05", 500))
+        self.data_source.modified = True
+        self.data_source.before_returning = lambda: self.refresher.apply(change)
+        self.assertFalse(self.refresher.refresh())
+        self.assertEqual(self.refresher.portfolio().total_value(), 300)
+        self.data_source.before_returning = None
+        self.assertTrue(self.refresher.refresh())
+        self.assertEqual(self.refresher.portfolio().total_value(), 5)
+
+    def test_it_reports_the_last_error_and_keeps_the_portfolio(self):
+        self.data_source.error = IOError("ledger is down")
+        self.assertFalse(self.refresher.refresh())
+        self.assertIs(self.refresher.portfolio(), self.portfolio)
+        self.assertIn("ledger is down", self.refresher.status()["last_error"])
+
+    def test_it_reports_its_status(self):
+        status = self.refresher.status()
+        self.assertEqual(status["interval"], 60)
+        self.assertFalse(status["stale"])
+        self.assertFalse(status["refreshing"])
+        self.assertIsNone(status["last_error"])
+
+    def test_it_reports_a_stale_portfolio(self):
+        refresher = PortfolioRefresher(self.data_source, Portfolio(), interval=0)
+        self.assertTrue(refresher.status()["stale"])
+
+    def test_it_refreshes_in_the_background(self):
+        self.data_source.fetched.clear()
+        refresher = PortfolioRefresher(self.data_source, self.portfolio, interval=0.01).start()
+        self.assertTrue(self.data_source.fetched.wait(5))
+        refresher.stop()
+
+    def test_it_loads_the_portfolio_on_first_use(self):
+        loads = []
+        refresher = PortfolioRefresher(self.data_source, loader=lambda: loads.append(1) or self.portfolio)
+        self.assertEqual(loads, [])
+        self.assertIs(refresher.portfolio(), self.portfolio)
+        self.assertIs(refresher.portfolio(), self.portfolio)
+        self.assertEqual(loads, [1])
+
+    def test_it_loads_the_portfolio_from_the_data_source_by_default(self):
+        self.data_source.modified = True
+        refresher = PortfolioRefresher(self.data_source)
+        self.assertEqual(refresher.portfolio().total_value(), 100)
+
+    def test_it_loads_the_portfolio_even_if_the_data_source_has_served_it_before(self):
+        self.data_source.modified = False
+        refresher = PortfolioRefresher(self.data_source)
+        self.assertEqual(refresher.portfolio().total_value(), 100)
+
+    def test_it_is_not_ready_before_the_portfolio_is_loaded(self):
+        refresher = PortfolioRefresher(self.data_source, loader=lambda: self.portfolio)
+        self.assertEqual(refresher.ready(), {"ready": False, "last_error": None})
+
+    def test_it_reports_the_load_time_and_size_once_ready(self):
+        refresher = PortfolioRefresher(self.data_source, loader=lambda: self.portfolio)
+        refresher.portfolio()
+        readiness = refresher.ready()
+        self.assertTrue(readiness["ready"])
+        self.assertGreaterEqual(readiness["load_time"], 0)
+        self.assertEqual((readiness["accounts"], readiness["snapshots"]), (1, 1))
+
+    def test_it_does_not_fetch_again_right_after_loading(self):
+        refresher = PortfolioRefresher(self.data_source)
+        self.assertFalse(refresher.refresh())
+        self.assertEqual(refresher.portfolio().total_value(), 100)
+        self.assertEqual(self.data_source.requests, [])
+
+    def test_it_reports_a_failed_load(self):
+        self.data_source.error = IOError("ledger is down")
+        refresher = PortfolioRefresher(self.data_source)
+        self.assertFalse(refresher.refresh())
+        self.assertIn("ledger is down", refresher.ready()["last_error"])
+
+    def test_it_warms_up_in_the_background(self):
+        loaded = threading.Event()
+        refresher = PortfolioRefresher(self.data_source, interval=60,
+                                       loader=lambda: loaded.set() or self.portfolio).start()
+        self.assertTrue(loaded.wait(5))
+        refresher.stop()
+        self.assertTrue(refresher.ready()["ready"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import json
+import unittest
+
+from portfolio_creator.snapshot_stream import SnapshotStream
+
+
+def chunked(text, size):
+    data = text.encode("utf-8")
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class SnapshotStreamTestCase(unittest.TestCase):
+    def setUp(self):
+        self.snapshots = [{"timestamp": "2017-01-02", "account": "Checking", "value": 98066, "open_date": None},
+                          {"timestamp": "2017-10-25", "account": "Café Card", "value": -1.5e3, "asset": False}]
+        self.document = json.dumps({"version": 12, "meta": {"snapshots": [1, 2]}, "snapshots": self.snapshots,
+                                    "tail": 1.5}, ensure_ascii=False)
+
+    def test_it_streams_the_snapshots_from_a_single_chunk(self):
+        self.assertEqual(list(SnapshotStream([self.document.encode("utf-8")])), self.snapshots)
+
+    def test_it_streams_the_snapshots_from_many_small_chunks(self):
+        for size in [1, 2, 3, 5, 16]:
+            self.assertEqual(list(SnapshotStream(chunked(self.document, size))), self.snapshots)
+
+    def test_it_streams_the_snapshots_from_text_chunks(self):
+        self.assertEqual(list(SnapshotStream([self.document[:10], self.document[10:]])), self.snapshots)
+
+    def test_it_streams_no_snapshots(self):
+        self.assertEqual(list(SnapshotStream([b'{"snapshots": []}'])), [])
+        self.assertEqual(list(SnapshotStream([b'{"other": [1]}'])), [])
+
+    def test_it_yields_each_snapshot_before_reading_the_rest_of_the_stream(self):
+        chunks = iter(chunked(self.document, 4))
+        stream = iter(SnapshotStream(chunks))
+        self.assertEqual(next(stream), self.snapshots[0])
+        self.assertTrue(len(list(chunks)) > 0)
+
+    def test_it_raises_an_error_for_a_truncated_stream(self):
+        self.assertRaises(ValueError, list, SnapshotStream([b'{"snapshots": [{"value": 1']))
+
+    def test_it_raises_an_error_for_a_stream_that_is_not_an_object(self):
+        self.assertRaises(ValueError, list, SnapshotStream([b'[1, 2]']))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import unittest
+
+from portfolio_creator.portfolio_creator import PortfolioCreator
+from portfolio_creator.sqlite_data_source import SqliteDataSource
+
+
+def snapshot(timestamp, account, value, asset=True, asset_class="Cash Equivalents"):
+    item = {"timestamp": timestamp, "institution": "John's Union", "account": account, "owner": "Robert",
+            "investment": "CASHX", "asset": asset, "value": value, "update_frequency": 12, "open_date": None,
+            "term": None}
+    if asset_class is not None:
+        item["asset_class"] = asset_class
+    return item
+
+
+class SqliteDataSourceTestCase(unittest.TestCase):
+    def setUp(self):
+        self.snapshots = [snapshot("2017-01-02", "Checking", 10000),
+                          snapshot("2017-01-05", "Credit Card", 2500, False, None),
+                          snapshot("2017-01-05", "Checking", 20000),
+                          snapshot("2017-1-9", "Checking", 15000),
+                          snapshot("2017-01-09", "Credit Card", 500, False, None)]
+        self.data_source = SqliteDataSource(":memory:")
+        self.data_source.import_json(json.dumps({"snapshots": self.snapshots}))
+
+    def test_it_imports_each_snapshot_once(self):
+        self.assertEqual(len(json.loads(self.data_source.get())["snapshots"]), 5)
+
+    def test_it_ignores_snapshots_that_were_already_imported(self):
+        version = self.data_source.version()
+        self.assertEqual(self.data_source.import_json(json.dumps({"snapshots": self.snapshots})), 0)
+        self.assertEqual(len(json.loads(self.data_source.get())["snapshots"]), 5)
+        self.assertEqual(self.data_source.version(), version)
+
+    def test_it_removes_duplicate_snapshots_from_an_existing_database(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "ledger.sqlite3")
+            connection = sqlite3.connect(path)
+            connection.executescript("CREATE TABLE snapshots (id INTEGER PRIMARY KEY, account_id INTEGER NOT NULL, "
+                                     "timestamp TEXT NOT NULL, value INTEGER NOT NULL);"
+                                     "INSERT INTO snapshots (account_id, timestamp, value) VALUES "
+                                     "(1, '2017-01-02', 100), (1, '2017-01-02', 100), (1, '2017-01-03', 100);")
+            connection.commit()
+            connection.close()
+            data_source = SqliteDataSource(path)
+            count = data_source.connection.execute("SELECT COUNT(*) FROM snapshots").fetchone()[0]
+            data_source.connection.close()
+            self.assertEqual(count, 2)
+
+    def test_it_removes_duplicate_snapshots_only_once(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "ledger.sqlite3")
+            connection = sqlite3.connect(path)
+            connection.executescript("CREATE TABLE snapshots (id INTEGER PRIMARY KEY, account_id INTEGER NOT NULL, "
+                                     "timestamp TEXT NOT NULL, value INTEGER NOT NULL);"
+                                     "CREATE INDEX snapshots_by_account_timestamp_and_value ON snapshots(account_id);"
+                                     "INSERT INTO snapshots (account_id, timestamp, value) VALUES "
+                                     "(1, '2017-01-02', 100), (1, '2017-01-02', 100);")
+            connection.commit()
+            connection.close()
+            data_source = SqliteDataSource(path)
+            count = data_source.connection.execute("SELECT COUNT(*) FROM snapshots").fetchone()[0]
+            data_source.connection.close()
+            self.assertEqual(count, 2)
+
+    def test_it_can_be_read_from_another_thread(self):
+        values = []
+        thread = threading.Thread(target=lambda: values.append(self.data_source.total_value("2017-01-05")))
+        thread.start()
+        thread.join()
+        self.assertEqual(values, [175])
+
+    def test_it_creates_one_row_per_account(self):
+        self.assertEqual(self.data_source.connection.execute("SELECT COUNT(*) FROM accounts").fetchone()[0], 2)
+
+    def test_it_returns_the_snapshots_in_the_ledger_format(self):
+        snapshots = json.loads(self.data_source.get())["snapshots"]
+        self.assertEqual(snapshots[0], self.snapshots[0])
+        self.assertEqual(snapshots[1], self.snapshots[1])
+        self.assertEqual(snapshots[3]["timestamp"], "2017-01-09")
+
+    def test_it_gets_the_snapshots_since_a_cursor(self):
+        snapshots = json.loads(self.data_source.get_since("2017-01-05"))["snapshots"]
+        self.assertEqual([s["timestamp"] for s in snapshots], ["2017-01-05", "2017-01-05", "2017-01-09", "2017-01-09"])
+
+    def test_it_creates_the_same_portfolio_as_the_ledger(self):
+        portfolio = PortfolioCreator().create(self.data_source)
+        self.assertEqual(len(portfolio.accounts), 2)
+        self.assertAlmostEqual(portfolio.total_value("2017-01-06"), 175)
+        self.assertAlmostEqual(portfolio.total_value(), self.data_source.total_value())
+
+    def test_it_does_not_return_data_for_an_assumed_version(self):
+        self.data_source.assume_version(self.data_source.version())
+        self.assertIsNone(self.data_source.get())
+        self.assertIsNone(self.data_source.stream())
+
+    def test_it_does_not_return_data_it_has_already_returned(self):
+        self.data_source.get()
+        self.assertIsNone(self.data_source.get())
+        self.assertIsNone(self.data_source.get_since("2017-01-05"))
+        self.data_source.import_snapshots([snapshot("2017-01-10", "Checking", 1)])
+        self.assertEqual(len(json.loads(self.data_source.get_since("2017-01-10"))["snapshots"]), 1)
+
+    def test_it_changes_version_after_an_import(self):
+        version = self.data_source.version()
+        self.data_source.assume_version(version)
+        self.data_source.import_snapshots([snapshot("2017-01-10", "Checking", 1)])
+        self.assertEqual(self.data_source.version(), version + 1)
+        self.assertIsNotNone(self.data_source.get())
+
+    def test_it_calculates_the_value_on_a_date(self):
+        self.assertEqual(self.data_source.total_value("2017-01-01"), 0)
+        self.assertEqual(self.data_source.total_value("2017-01-02"), 100)
+        self.assertEqual(self.data_source.total_value("2017-01-05"), 175)
+        self.assertEqual(self.data_source.total_value("2017-01-09"), 145)
+
+    def test_it_calculates_the_assets_and_liabilities_on_a_date(self):
+        self.assertEqual(self.data_source.assets_value("2017-01-06"), 200)
+        self.assertEqual(self.data_source.liabilities_value("2017-01-06"), 25)
+
+    def test_it_uses_the_last_snapshot_imported_on_a_day(self):
+        self.data_source.import_snapshots([snapshot("2017-01-09", "Checking", 30000)])
+        self.assertEqual(self.data_source.assets_value("2017-01-09"), 300)
+
+    def test_it_calculates_the_values_over_a_range_of_dates(self):
+        self.assertEqual(self.data_source.values_between("2017-01-01", "2017-01-10"),
+                         [0, 100, 100, 100, 175, 175, 175, 175, 145, 145])
+
+    def test_it_calculates_the_values_over_a_range_starting_after_the_first_snapshot(self):
+        self.assertEqual(self.data_source.values_between("2017-01-06", "2017-01-09"), [175, 175, 175, 145])
+
+    def test_it_calculates_the_assets_and_liabilities_over_a_range_of_dates(self):
+        self.assertEqual(self.data_source.assets_values_between("2017-01-04", "2017-01-09"),
+                         [100, 200, 200, 200, 200, 150])
+        self.assertEqual(self.data_source.liabilities_values_between("2017-01-04", "2017-01-09"),
+                         [0, 25, 25, 25, 25, 5])
+
+    def test_it_returns_no_values_for_an_empty_range(self):
+        self.assertEqual(self.data_source.values_between("2017-01-09", "2017-01-01"), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
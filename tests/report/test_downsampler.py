@@ -0,0 +1,35 @@
+import unittest
+
+import numpy
+
+from report.downsampler import Downsampler
+
+
+class DownsamplerTestCase(unittest.TestCase):
+    def test_it_keeps_every_point_of_a_short_series(self):
+        indices = Downsampler.largest_triangle_three_buckets([1, 2, 3], [5, 6, 7], 5)
+        self.assertEqual(list(indices), [0, 1, 2])
+
+    def test_it_returns_the_requested_number_of_points(self):
+        xs = numpy.arange(1000)
+        indices = Downsampler.largest_triangle_three_buckets(xs, numpy.sin(xs / 50), 40)
+        self.assertEqual(len(indices), 40)
+        self.assertEqual(list(indices), sorted(set(indices)))
+
+    def test_it_keeps_the_first_and_last_points(self):
+        xs = numpy.arange(100)
+        indices = Downsampler.largest_triangle_three_buckets(xs, xs * 2, 10)
+        self.assertEqual((indices[0], indices[-1]), (0, 99))
+
+    def test_it_keeps_a_spike(self):
+        ys = numpy.zeros(100)
+        ys[37] = 1000
+        indices = Downsampler.largest_triangle_three_buckets(numpy.arange(100), ys, 5)
+        self.assertIn(37, list(indices))
+
+    def test_it_needs_at_least_three_points(self):
+        self.assertRaises(ValueError, Downsampler.largest_triangle_three_buckets, [1, 2, 3, 4], [1, 2, 3, 4], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
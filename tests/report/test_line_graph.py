@@ -68,3 +68,159 @@ class LineGraphTestCase(unittest.TestCase):
         self.assertEqual(net_worth_values[4], {"series": "net-worth", "date": "2009-10-17", "value": -990})
         self.assertEqual(net_worth_values[5], {"series": "net-worth", "date": "2009-10-18", "value": -990})
         self.assertEqual(net_worth_values[6], {"series": "net-worth", "date": "2009-10-19", "value": -990})
+
+    def test_it_returns_one_value_per_calendar_day_across_a_long_range(self):
+        account = AccountBuilder().set_name("name")\
+            .set_institution("institution")\
+            .set_owner("Craig")\
+            .set_investment("investment")\
+            .build()
+        account.import_snapshot(EpochDateConverter().date_to_epoch("2001-03-01"), 10)
+        account.import_snapshot(EpochDateConverter().date_to_epoch("2010-03-01"), 20)
+        self.portfolio.import_account(account)
+        line_graph = LineGraph(self.portfolio)
+        net_worth_values = line_graph.net_worth_vs_time("2000-01-01", "2019-12-31")
+        dates = [value["date"] for value in net_worth_values]
+        self.assertEqual(len(dates), 7305)
+        self.assertEqual(len(set(dates)), 7305)
+        self.assertEqual(net_worth_values[0]["value"], 0)
+        self.assertEqual(net_worth_values[dates.index("2001-03-01")]["value"], 10)
+        self.assertEqual(net_worth_values[dates.index("2010-02-28")]["value"], 10)
+        self.assertEqual(net_worth_values[-1]["value"], 20)
+
+    def test_it_samples_the_first_day_of_each_week(self):
+        self.__import_long_history()
+        net_worth_values = LineGraph(self.portfolio).net_worth_vs_time("2001-02-20", "2001-03-15", "weekly")
+        self.assertEqual([value["date"] for value in net_worth_values],
+                         ["2001-02-20", "2001-02-27", "2001-03-06", "2001-03-13", "2001-03-15"])
+        self.assertEqual([value["value"] for value in net_worth_values], [0, 0, 10, 10, 10])
+
+    def test_it_samples_the_first_day_of_each_month(self):
+        self.__import_long_history()
+        net_worth_values = LineGraph(self.portfolio).net_worth_vs_time("2009-11-15", "2010-03-31", "monthly")
+        self.assertEqual([value["date"] for value in net_worth_values],
+                         ["2009-11-15", "2009-12-01", "2010-01-01", "2010-02-01", "2010-03-01", "2010-03-31"])
+        self.assertEqual(net_worth_values[-2]["value"], 20)
+
+    def test_it_rejects_an_unknown_resolution(self):
+        self.assertRaises(ValueError, LineGraph(self.portfolio).net_worth_vs_time, "2001-01-01", "2001-02-01", "yearly")
+
+    def test_it_returns_every_day_if_the_range_fits_in_the_maximum_number_of_points(self):
+        self.__import_long_history()
+        net_worth_values = LineGraph(self.portfolio).net_worth_vs_time("2001-02-20", "2001-03-15", max_points=100)
+        self.assertEqual(len(net_worth_values), 24)
+
+    def test_it_keeps_the_corners_of_each_step_when_downsampling(self):
+        self.__import_long_history()
+        net_worth_values = LineGraph(self.portfolio).net_worth_vs_time("2000-01-01", "2019-12-31", max_points=100)
+        self.assertEqual([(value["date"], value["value"]) for value in net_worth_values],
+                         [("2000-01-01", 0), ("2001-02-28", 0), ("2001-03-01", 10),
+                          ("2010-02-28", 10), ("2010-03-01", 20), ("2019-12-31", 20)])
+
+    def test_it_downsamples_to_the_maximum_number_of_points(self):
+        account = self.__account()
+        for day in range(0, 400, 2):
+            account.import_snapshot(EpochDateConverter().date_to_epoch("2001-01-01") + day * 86400, day % 7)
+        self.portfolio.import_account(account)
+        net_worth_values = LineGraph(self.portfolio).net_worth_vs_time("2001-01-01", "2002-12-31", max_points=50)
+        self.assertEqual(len(net_worth_values), 50)
+        self.assertEqual(net_worth_values[0]["date"], "2001-01-01")
+        self.assertEqual(net_worth_values[-1]["date"], "2002-12-31")
+
+    def test_it_returns_daily_values_as_columns(self):
+        self.__import_long_history()
+        columns = LineGraph(self.portfolio).net_worth_columns("2001-02-27", "2001-03-02")
+        self.assertEqual(columns["series"], "net-worth")
+        self.assertEqual(columns["start"], "2001-02-27")
+        self.assertEqual(columns["step"], 1)
+        self.assertEqual(list(columns["values"]), [0, 0, 10, 10])
+        self.assertNotIn("offsets", columns)
+
+    def test_it_returns_a_regular_step_for_evenly_spaced_samples(self):
+        self.__import_long_history()
+        columns = LineGraph(self.portfolio).net_worth_columns("2001-02-20", "2001-03-13", "weekly")
+        self.assertEqual(columns["step"], 7)
+        self.assertEqual(list(columns["values"]), [0, 0, 10, 10])
+
+    def test_it_returns_offsets_for_unevenly_spaced_samples(self):
+        self.__import_long_history()
+        columns = LineGraph(self.portfolio).net_worth_columns("2000-01-01", "2019-12-31", max_points=100)
+        self.assertNotIn("step", columns)
+        self.assertEqual(list(columns["offsets"]), [0, 424, 425, 3711, 3712, 7304])
+        self.assertEqual(list(columns["values"]), [0, 0, 10, 10, 20, 20])
+
+    def test_it_returns_the_same_values_as_columns_and_as_rows(self):
+        self.__import_long_history()
+        rows = LineGraph(self.portfolio).net_worth_vs_time("2000-01-01", "2019-12-31", "monthly")
+        columns = LineGraph(self.portfolio).net_worth_columns("2000-01-01", "2019-12-31", "monthly")
+        self.assertEqual(list(columns["values"]), [row["value"] for row in rows])
+
+    def test_it_returns_the_standard_series_from_one_sweep(self):
+        self.__import_household()
+        output = LineGraph(self.portfolio).series("2012-01-01", "2012-01-04")
+        self.assertEqual((output["start"], output["step"]), ("2012-01-01", 1))
+        self.assertEqual(list(output["series"].keys()),
+                         ["assets", "liabilities", "net-worth", "liabilities-without-mortgage"])
+        self.assertEqual(list(output["series"]["assets"]), [0, 100, 100, 100])
+        self.assertEqual(list(output["series"]["liabilities"]), [0, 0, 30, 530])
+        self.assertEqual(list(output["series"]["net-worth"]), [0, 100, 70, -430])
+        self.assertEqual(list(output["series"]["liabilities-without-mortgage"]), [0, 0, 30, 30])
+
+    def test_it_breaks_the_net_worth_down_by_owner(self):
+        self.__import_household()
+        output = LineGraph(self.portfolio).series("2012-01-01", "2012-01-04", "owner")
+        self.assertEqual(list(output["series"]["owner:Craig"]), [0, 100, 70, 70])
+        self.assertEqual(list(output["series"]["owner:Samuel"]), [0, 0, 0, -500])
+
+    def test_it_breaks_the_net_worth_down_by_several_dimensions(self):
+        self.__import_household()
+        output = LineGraph(self.portfolio).series("2012-01-01", "2012-01-04", ["institution", "asset_class"])
+        self.assertEqual(list(output["series"]["institution:institution"]), [0, 100, 100, 100])
+        self.assertEqual(list(output["series"]["institution:bank"]), [0, 0, -30, -30])
+        self.assertEqual(list(output["series"]["asset_class:Cash Equivalents"]), [0, 100, 100, 100])
+        self.assertEqual(list(output["series"]["asset_class:None"]), [0, 0, -30, -530])
+
+    def test_it_matches_the_net_worth_series(self):
+        self.__import_household()
+        rows = LineGraph(self.portfolio).net_worth_vs_time("2011-12-01", "2012-02-01", "weekly")
+        output = LineGraph(self.portfolio).series("2011-12-01", "2012-02-01", resolution="weekly")
+        self.assertEqual(list(output["series"]["net-worth"]), [row["value"] for row in rows])
+        self.assertEqual(len(output["offsets"]), len(rows))
+
+    def test_it_reads_the_series_from_the_portfolio_net_worth_timeline(self):
+        self.__import_household()
+        timeline = self.portfolio.net_worth_timeline()
+        requests = []
+        self.portfolio.net_worth_timeline = lambda: requests.append(timeline) or timeline
+        output = LineGraph(self.portfolio).series("2012-01-01", "2012-01-04", "owner")
+        self.assertEqual(requests, [timeline])
+        self.assertEqual(list(output["series"]["net-worth"]), [0, 100, 70, -430])
+
+    def test_it_rejects_an_unknown_breakdown(self):
+        self.assertRaises(ValueError, LineGraph(self.portfolio).series, "2012-01-01", "2012-01-04", "term")
+
+    def __account(self):
+        return AccountBuilder().set_name("name")\
+            .set_institution("institution")\
+            .set_owner("Craig")\
+            .set_investment("investment")\
+            .build()
+
+    def __import_long_history(self):
+        account = self.__account()
+        account.import_snapshot(EpochDateConverter().date_to_epoch("2001-03-01"), 10)
+        account.import_snapshot(EpochDateConverter().date_to_epoch("2010-03-01"), 20)
+        self.portfolio.import_account(account)
+
+    def __import_household(self):
+        converter = EpochDateConverter()
+        stocks = self.__account()
+        stocks.import_snapshot(converter.date_to_epoch("2012-01-02"), 100)
+        credit_card = AccountBuilder().set_name("Credit Card").set_institution("bank").set_owner("Craig")\
+            .set_investment("CASHX").set_liability().build()
+        credit_card.import_snapshot(converter.date_to_epoch("2012-01-03"), 30)
+        mortgage = AccountBuilder().set_name("Mortgage").set_institution("lender").set_owner("Samuel")\
+            .set_investment("CASHX").set_liability().build()
+        mortgage.import_snapshot(converter.date_to_epoch("2012-01-04"), 500)
+        for account in [stocks, credit_card, mortgage]:
+            self.portfolio.import_account(account)
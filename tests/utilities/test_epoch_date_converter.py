@@ -56,6 +56,39 @@ class EpochTimestampConverterTestCase(unittest.TestCase):
         epoch = self.converter.date_to_epoch(date)
         self.assertEqual(self.converter.epoch_to_date(epoch), date)
 
+    def test_it_converts_many_dates_to_epochs(self):
+        dates = ["2011-02-03", "2011-01-01", "2011-02-03"]
+        epochs = self.converter.dates_to_epochs(dates)
+        self.assertEqual(epochs, [self.converter.date_to_epoch(date) for date in dates])
+
+    def test_it_converts_no_dates_to_no_epochs(self):
+        self.assertEqual(self.converter.dates_to_epochs([]), [])
+
+    def test_it_converts_a_date_without_leading_zeros(self):
+        self.assertEqual(self.converter.date_to_epoch("2017-1-1"), self.converter.date_to_epoch("2017-01-01"))
+
+    def test_it_shares_one_timezone_between_converters(self):
+        self.assertIs(EpochDateConverter().tz, EpochDateConverter().tz)
+
+    def test_it_converts_a_date_to_a_day_ordinal(self):
+        self.assertEqual(self.converter.date_to_ordinal("0001-01-02"), 2)
+        self.assertEqual(self.converter.date_to_ordinal("2017-1-1"), datetime.date(2017, 1, 1).toordinal())
+
+    def test_it_converts_a_day_ordinal_to_a_date(self):
+        self.assertEqual(self.converter.ordinal_to_date(datetime.date(2011, 2, 3).toordinal()), "2011-02-03")
+
+    def test_it_converts_an_epoch_to_the_ordinal_of_its_local_date(self):
+        epoch = self.converter.date_to_epoch("2011-02-03")
+        self.assertEqual(self.converter.epoch_to_ordinal(epoch), self.converter.date_to_ordinal("2011-02-03"))
+        self.assertEqual(self.converter.epoch_to_ordinal(epoch + 86399), self.converter.date_to_ordinal("2011-02-03"))
+
+    def test_it_converts_a_day_ordinal_to_an_epoch_and_back(self):
+        ordinal = self.converter.date_to_ordinal("2011-02-03")
+        self.assertEqual(self.converter.epoch_to_ordinal(self.converter.ordinal_to_epoch(ordinal)), ordinal)
+
+    def test_it_returns_the_ordinal_of_the_current_date_given_no_date(self):
+        self.assertEqual(self.converter.date_to_ordinal(), self.converter.date_to_ordinal(self.converter.epoch_to_date()))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+
+from utilities.response_cache import ResponseCache
+
+
+class ResponseCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.cache = ResponseCache(max_entries=2)
+
+    def test_it_returns_nothing_for_an_unknown_key(self):
+        self.assertIsNone(self.cache.get(1, "/net_worth"))
+
+    def test_it_returns_a_stored_response(self):
+        self.cache.put(1, "/net_worth", b"[]")
+        self.assertEqual(self.cache.get(1, "/net_worth"), b"[]")
+
+    def test_it_drops_every_response_when_the_version_changes(self):
+        self.cache.put(1, "/net_worth", b"[]")
+        self.cache.put(1, "/accounts", b"<html>")
+        self.assertIsNone(self.cache.get(2, "/net_worth"))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_it_keeps_the_newest_version_when_an_older_one_is_requested(self):
+        self.cache.put(2, "/net_worth", b"[2]")
+        self.cache.put(1, "/net_worth", b"[1]")
+        self.assertIsNone(self.cache.get(1, "/net_worth"))
+        self.assertEqual(self.cache.get(2, "/net_worth"), b"[2]")
+        self.assertEqual(len(self.cache), 1)
+
+    def test_it_evicts_the_least_recently_used_response(self):
+        self.cache.put(1, "/net_worth", b"[]")
+        self.cache.put(1, "/accounts", b"<html>")
+        self.cache.get(1, "/net_worth")
+        self.cache.put(1, "/balance_sheet_rows", b"{}")
+        self.assertEqual(self.cache.get(1, "/net_worth"), b"[]")
+        self.assertIsNone(self.cache.get(1, "/accounts"))
+        self.assertEqual(len(self.cache), 2)
+
+    def test_it_creates_the_same_etag_for_the_same_version_and_key(self):
+        self.assertEqual(ResponseCache.etag(1, "/net_worth"), ResponseCache.etag(1, "/net_worth"))
+
+    def test_it_creates_a_different_etag_for_a_different_version_or_key(self):
+        self.assertNotEqual(ResponseCache.etag(1, "/net_worth"), ResponseCache.etag(2, "/net_worth"))
+        self.assertNotEqual(ResponseCache.etag(1, "/net_worth"), ResponseCache.etag(1, "/accounts"))
+
+
+if __name__ == '__main__':
+    unittest.main()
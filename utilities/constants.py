@@ -1,6 +1,20 @@
+import os
+
+
 class Constants:
     GENERAL_LEDGER_HEADERS = ["Timestamp", "Institution", "Description", "Owner", "Investment", "Account Type", "Value", "Asset Class"]
     LIABILITIES_HEADERS = ["Last Updated", "Institution", "Account", "Owner", "Value"]
     SECONDS_PER_DAY = 86400
     DAYS_PER_YEAR = 365
     DATA_URL = "http://localhost:4567"
+    REFRESH_INTERVAL_SECONDS = 300
+    REQUEST_TIMEOUT_SECONDS = 10
+    CONNECTION_POOL_SIZE = 10
+    STREAM_CHUNK_SIZE = 65536
+    STREAM_BATCH_SIZE = 10000
+    ROOT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    PORTFOLIO_CACHE_PATH = os.path.join(ROOT_DIRECTORY, "portfolio.cache")
+    SQLITE_PATH = os.path.join(ROOT_DIRECTORY, "ledger.sqlite3")
+    RESPONSE_CACHE_SIZE = 128
+    ROLLING_PERIOD_DAYS = 30
+    VOLATILITY_WINDOW_DAYS = 30
@@ -1,37 +1,74 @@
 import datetime
+import functools
 import time
 
 from dateutil.tz import tzlocal
 
 
 class EpochDateConverter:
+    TIMEZONE = tzlocal()
+    CACHE_SIZE = 8192
+
     def __init__(self):
-        self.tz = tzlocal()
+        self.tz = EpochDateConverter.TIMEZONE
 
     def date_to_epoch(self, date=None):
         if date is None:
             return time.time()
         else:
-            return self.__calculate_epoch_from_date(date)
+            return EpochDateConverter.__calculate_epoch_from_date(date)
+
+    def dates_to_epochs(self, dates):
+        return [self.date_to_epoch(date) for date in dates]
 
     def epoch_to_date(self, epoch=None):
         if epoch is None:
             return self.epoch_to_date(self.date_to_epoch())
         else:
-            return datetime.datetime.fromtimestamp(epoch, self.tz).strftime('%Y-%m-%d')
+            return EpochDateConverter.__calculate_date_from_epoch(epoch)
+
+    def date_to_ordinal(self, date=None):
+        if date is None:
+            return self.epoch_to_ordinal()
+        else:
+            return EpochDateConverter.__calculate_ordinal_from_date(date)
+
+    def epoch_to_ordinal(self, epoch=None):
+        if epoch is None:
+            return self.epoch_to_ordinal(self.date_to_epoch())
+        else:
+            return EpochDateConverter.__calculate_ordinal_from_epoch(epoch)
+
+    def ordinal_to_date(self, ordinal):
+        return datetime.date.fromordinal(ordinal).isoformat()
+
+    def ordinal_to_epoch(self, ordinal):
+        return self.date_to_epoch(self.ordinal_to_date(ordinal))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=CACHE_SIZE)
+    def __calculate_ordinal_from_epoch(epoch):
+        return datetime.datetime.fromtimestamp(epoch, EpochDateConverter.TIMEZONE).toordinal()
 
-    def __calculate_epoch_from_date(self, date):
-        split_date = self.__split_date(date)
-        return datetime.datetime(year=split_date["year"],
-                                 month=split_date["month"],
-                                 day=split_date["day"],
+    @staticmethod
+    @functools.lru_cache(maxsize=CACHE_SIZE)
+    def __calculate_ordinal_from_date(date):
+        year, month, day = date.split("-")
+        return datetime.date(int(year), int(month), int(day)).toordinal()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=CACHE_SIZE)
+    def __calculate_date_from_epoch(epoch):
+        return datetime.datetime.fromtimestamp(epoch, EpochDateConverter.TIMEZONE).strftime('%Y-%m-%d')
+
+    @staticmethod
+    @functools.lru_cache(maxsize=CACHE_SIZE)
+    def __calculate_epoch_from_date(date):
+        year, month, day = date.split("-")
+        return datetime.datetime(year=int(year),
+                                 month=int(month),
+                                 day=int(day),
                                  hour=0,
                                  minute=0,
                                  second=0,
-                                 tzinfo=self.tz).timestamp()
-
-    def __split_date(self, date_string):
-        year = int(date_string.split("-")[0])
-        month = int(date_string.split("-")[1])
-        day = int(date_string.split("-")[2])
-        return {"year": year, "month": month, "day": day}
+                                 tzinfo=EpochDateConverter.TIMEZONE).timestamp()
@@ -0,0 +1,45 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+from utilities.constants import Constants
+
+
+class ResponseCache:
+    def __init__(self, max_entries=Constants.RESPONSE_CACHE_SIZE):
+        self.max_entries = max_entries
+        self.__entries = OrderedDict()
+        self.__version = None
+        self.__lock = threading.Lock()
+
+    def get(self, version, key):
+        with self.__lock:
+            if not self.__is_current(version):
+                return None
+            entry = self.__entries.get(key)
+            if entry is not None:
+                self.__entries.move_to_end(key)
+            return entry
+
+    def put(self, version, key, entry):
+        with self.__lock:
+            if not self.__is_current(version):
+                return
+            self.__entries[key] = entry
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.max_entries:
+                self.__entries.popitem(last=False)
+
+    def __len__(self):
+        return len(self.__entries)
+
+    @staticmethod
+    def etag(version, key):
+        digest = hashlib.sha1(repr((version, key)).encode("utf-8")).hexdigest()
+        return digest[:20]
+
+    def __is_current(self, version):
+        if self.__version is None or version > self.__version:
+            self.__entries.clear()
+            self.__version = version
+        return version == self.__version